@@ -0,0 +1,92 @@
+import sys
+from filecmp import cmp
+from os import listdir, makedirs
+from os.path import join
+from tempfile import TemporaryDirectory
+
+import matplotlib
+
+from benchmarks.scaling import YEAR
+from benchmarks.synthetic_ledger import synthetic_ledger, write_ledger
+from benchmarks.timing import best_time
+
+# how many transactions the ledger the charts are drawn from has
+ROWS = 20_000
+
+
+def main() -> None:
+    """
+    Times drawing each monthly chart for every month of a synthetic ledger, with
+    a new figure each month and with figure reuse, and checks that both draw the
+    same charts.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    # the pipeline reads the command line itself
+    del sys.argv[1:]
+    matplotlib.use("Agg")
+
+    from src.models.paths import Paths
+    from src.read_config.plotters_from_config import plotters_from_config
+    from src.read_data.read_data import _parse_data, get_month_dfs
+    from src.utilities.get_funcs_from_module import (
+        get_funcs_from_module,
+        get_modules_from_folder,
+    )
+    from src.visualizations.figure_reuse import (
+        disable_figure_reuse,
+        enable_figure_reuse,
+    )
+
+    Paths._year_mut[0] = YEAR
+    plotters = plotters_from_config()[0] + [
+        func
+        for mod in get_modules_from_folder(join("src", "visualizations", "monthly"))
+        for func in get_funcs_from_module(mod)
+    ]
+
+    with TemporaryDirectory() as tmp:
+        path = join(tmp, "Spending.csv")
+        write_ledger(synthetic_ledger(ROWS, year=YEAR), path)
+        months = get_month_dfs(_parse_data(path))
+        for mode in ("new", "reused"):
+            for i in range(len(months)):
+                makedirs(join(tmp, mode, str(i)))
+
+        print(f"{'chart':>24} {'new':>9} {'reused':>9}  per month")
+        for plotter in plotters:
+            times = {}
+            for mode in ("new", "reused"):
+                if mode == "reused":
+                    enable_figure_reuse()
+
+                times[mode] = best_time(
+                    lambda: [
+                        plotter(df, join(tmp, mode, str(i)))
+                        for i, df in enumerate(months)
+                    ]
+                ) / len(months)
+                disable_figure_reuse()
+
+            name = getattr(plotter, "__name__", None) or plotter.args[0].plot_name
+            print(
+                f"{name:>24} {times['new'] * 1e3:7.1f}ms {times['reused'] * 1e3:7.1f}ms"
+                + f"  ({1 - times['reused'] / times['new']:.0%} faster)"
+            )
+
+        for i in range(len(months)):
+            for chart in sorted(listdir(join(tmp, "new", str(i)))):
+                if not cmp(
+                    join(tmp, "new", str(i), chart),
+                    join(tmp, "reused", str(i), chart),
+                    shallow=False,
+                ):
+                    print(f"{chart} for month {i + 1} differs with figure reuse")
+
+
+if __name__ == "__main__":
+    main()
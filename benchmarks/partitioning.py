@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, List, Tuple
+from datetime import date
+
+from benchmarks.timing import best_time
+from src.read_data.column import Column
+from src.utilities.df_common import group_by_month, group_by_week
+from src.utilities.helpers import get_months, get_weeks
+
+
+def _masked_partitions(
+    df: pd.DataFrame, date_func: Callable[[date, date], List[date]]
+) -> Tuple[List[date], List[pd.DataFrame]]:
+    """
+    The old way of partitioning, with one full-column mask per period. Kept as a
+    reference point for the timings.
+    """
+    dates = date_func(df[Column.DATE].min().date(), df[Column.DATE].max().date())
+    partitions = []
+    for i in range(len(dates) - 1):
+        partitions.append(
+            df.loc[
+                (pd.to_datetime(df[Column.DATE]).dt.date >= dates[i])
+                & (pd.to_datetime(df[Column.DATE]).dt.date < dates[i + 1])
+            ]
+        )
+
+    partitions.append(df.loc[pd.to_datetime(df[Column.DATE]).dt.date >= dates[-1]])
+    return dates, partitions
+
+
+def _year_of_rows(rows: int) -> pd.DataFrame:
+    """
+    Generates `rows` transactions spread randomly over a year.
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            Column.DATE: pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(np.sort(rng.integers(0, 366, rows)), unit="D"),
+            Column.PRICE: rng.gamma(2, 20, rows),
+        }
+    )
+
+
+def main() -> None:
+    """
+    Times partitioning a year of data by week and by month, at a few sizes.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    print(f"{'rows':>10} {'period':>7} {'partitioned':>12} {'masked':>10}")
+    for rows in (10_000, 100_000, 1_000_000):
+        df = _year_of_rows(rows)
+        for name, grouper, date_func in (
+            ("week", group_by_week, get_weeks),
+            ("month", group_by_month, get_months),
+        ):
+            new = best_time(lambda: grouper(df))
+            old = (
+                f"{best_time(lambda: _masked_partitions(df, date_func), 1):9.3f}s"
+                if rows <= 100_000
+                else f"{'-':>10}"
+            )
+            print(f"{rows:>10} {name:>7} {new:11.3f}s {old}")
+
+
+if __name__ == "__main__":
+    main()
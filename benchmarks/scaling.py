@@ -0,0 +1,242 @@
+import argparse
+import json
+import platform
+import sys
+from os.path import join
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Tuple
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_ledger import synthetic_ledger, write_ledger
+from benchmarks.timing import best_time
+
+# the year the synthetic ledgers start in
+YEAR = 2024
+
+# the sizes `--full` times, up to the largest ledgers worth supporting
+FULL_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+# writing xlsx files is slow enough that larger ones aren't worth timing
+XLSX_MAX_ROWS = 200_000
+
+# a result more than this many times, and this many seconds, slower than the
+# baseline is a regression
+REGRESSION_RATIO = 1.2
+REGRESSION_SECONDS = 0.01
+
+
+def _parse_args() -> argparse.Namespace:
+    """
+    Returns the benchmark's command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.scaling",
+        description="Time each stage of the pipeline on synthetic ledgers.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda s: [int(size) for size in s.split(",")],
+        default=[10_000, 100_000, 1_000_000],
+        help="comma separated numbers of rows. Default 10000,100000,1000000",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="time 10000,100000,1000000,10000000 rows instead of --sizes. This"
+        + " takes several minutes and a few GB of memory. Default False",
+    )
+    parser.add_argument(
+        "--years",
+        type=int,
+        default=1,
+        help=f"how many years each ledger spans, starting in {YEAR}. Default 1",
+    )
+    parser.add_argument(
+        "--formats",
+        type=lambda s: s.split(","),
+        default=["csv", "xlsx"],
+        help=f"comma separated file formats. xlsx is skipped above {XLSX_MAX_ROWS}"
+        + " rows. Default csv,xlsx",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Default 0")
+    parser.add_argument("--repeat", type=int, default=3, help="Default 3")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="scaling.json",
+        help="where to write the results. Default scaling.json",
+    )
+    parser.add_argument(
+        "--compare", help="a previous output to compare the results against"
+    )
+    return parser.parse_args()
+
+
+def _stages(path: str, out_dir: str) -> Dict[str, Callable[[], object]]:
+    """
+    Returns each stage of the pipeline to time on the spreadsheet at `path`. The
+    later stages run on a fresh copy of the data each time, so that they can't
+    reuse results cached by frame from an earlier run.
+    """
+    import matplotlib.pyplot as plt
+
+    from src.calculations.weekly_projection import weekly_projection
+    from src.read_config.plotters_from_config import plotters_from_config
+    from src.read_data.read_data import _parse_data
+    from src.utilities.df_common import group_by_week
+    from src.visualizations.yearly.sankey_flow import sankey_flow
+
+    df = _parse_data(path)
+    config_plot = plotters_from_config()[1][0]
+
+    def plot(plotter: Callable[[pd.DataFrame, str], None]) -> None:
+        plotter(df.copy(), out_dir)
+        plt.close("all")
+
+    return {
+        "read_data": lambda: _parse_data(path),
+        "group_by_week": lambda: group_by_week(df.copy()),
+        "weekly_projection": lambda: weekly_projection(df.copy()),
+        "create_plot": lambda: plot(config_plot),
+        "sankey_flow": lambda: plot(sankey_flow),
+    }
+
+
+def run(
+    sizes: List[int],
+    formats: List[str],
+    seed: int = 0,
+    repeat: int = 3,
+    years: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    Times each stage of the pipeline on a synthetic ledger of each size, written
+    to a spreadsheet of each format.
+
+    Parameters:
+        sizes (List[int]): how many rows each ledger should have
+        formats (List[str]): the file extensions to write the ledgers as
+        seed (int): the seed of the ledgers. Default is 0
+        repeat (int): how many times to time each stage, keeping the fastest.
+            Default is 3
+        years (int): how many years each ledger spans. Default is 1
+
+    Returns:
+        results (List[Dict[str, Any]]): a result for each size, format and stage,
+            with the fastest time in seconds
+    """
+    results = []
+    with TemporaryDirectory() as tmp:
+        for rows in sizes:
+            ledger = synthetic_ledger(rows, seed, YEAR, years=years)
+            for fmt in formats:
+                if fmt == "xlsx" and rows > XLSX_MAX_ROWS:
+                    continue
+
+                path = join(tmp, f"Spending_{rows}.{fmt}")
+                write_ledger(ledger, path)
+                for stage, func in _stages(path, tmp).items():
+                    seconds = best_time(func, repeat)
+                    results.append(
+                        {
+                            "rows": rows,
+                            "years": years,
+                            "format": fmt,
+                            "stage": stage,
+                            "seconds": seconds,
+                        }
+                    )
+                    print(f"{rows:>10} {fmt:>5} {stage:>18} {seconds:9.3f}s")
+
+    return results
+
+
+def _result_key(result: Dict[str, Any]) -> Tuple[int, int, str, str]:
+    """
+    Returns what a result timed, counting results from before ledgers could
+    span several years as one year.
+    """
+    return (result["rows"], result.get("years", 1), result["format"], result["stage"])
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]]) -> int:
+    """
+    Prints how the results compare to a baseline from an earlier run.
+
+    Parameters:
+        results (List[Dict[str, Any]]): the results from `run`
+        baseline (List[Dict[str, Any]]): the results of the earlier run
+
+    Returns:
+        regressions (int): how many results were more than `REGRESSION_RATIO`
+            times and `REGRESSION_SECONDS` seconds slower than the baseline
+    """
+    before = {_result_key(r): r["seconds"] for r in baseline}
+    regressions = 0
+    for result in results:
+        key = _result_key(result)
+        if key not in before:
+            continue
+
+        ratio = result["seconds"] / max(before[key], 1e-9)
+        slower = (
+            ratio > REGRESSION_RATIO
+            and result["seconds"] - before[key] > REGRESSION_SECONDS
+        )
+        regressions += slower
+        print(
+            f"{key[0]:>10} {key[2]:>5} {key[3]:>18} {before[key]:9.3f}s ->"
+            + f" {result['seconds']:9.3f}s ({ratio:.2f}x){' SLOWER' if slower else ''}"
+        )
+
+    return regressions
+
+
+def main() -> None:
+    """
+    Runs the benchmarks with the command line arguments and writes the results
+    as JSON, exiting with an error if `--compare` finds any regressions.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    args = _parse_args()
+
+    # the pipeline reads the command line itself, and would reject these arguments
+    del sys.argv[1:]
+    matplotlib.use("Agg")
+
+    from src.models.paths import Paths
+
+    Paths._year_mut[0] = YEAR
+
+    sizes = FULL_SIZES if args.full else args.sizes
+    results = run(sizes, args.formats, args.seed, args.repeat, args.years)
+    with open(args.output, "w") as out:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "pandas": pd.__version__,
+                "numpy": np.__version__,
+                "seed": args.seed,
+                "results": results,
+            },
+            out,
+            indent=2,
+        )
+
+    print(f"Wrote {args.output}")
+    if args.compare is not None:
+        with open(args.compare) as f:
+            if compare(results, json.load(f)["results"]):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
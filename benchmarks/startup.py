@@ -0,0 +1,132 @@
+import argparse
+import json
+import re
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+# the module each subcommand imports before it starts running
+SUBCOMMAND_MODULES = {
+    "main": "main",
+    "init": "src.initialize",
+    "cli": "src.analyze_spending",
+    "ui": "src.drivers.ui.ui_driver",
+}
+
+# matches the lines `python -X importtime` writes, e.g.
+# "import time:       897 |       4282 |   traceback"
+_IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _parse_args() -> argparse.Namespace:
+    """
+    Returns the benchmark's command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Time the imports each subcommand does before it starts.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Default 5")
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="how many of the slowest imports to list for each. Default 5",
+    )
+    parser.add_argument("-o", "--output", help="where to also write the results")
+    return parser.parse_args()
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Imports `module` in a new interpreter with `python -X importtime`, and
+    returns how long each module it imported took, including its own imports.
+
+    Parameters:
+        module (str): the module to import
+
+    Returns:
+        times (Dict[str, int]): the cumulative import time of each module, in
+            microseconds, with the total under the empty string
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    times = {"": 0}
+    for match in _IMPORT_TIME.finditer(stderr):
+        cumulative, indent, name = int(match[2]), match[3], match[4]
+        times[name] = cumulative
+        # modules imported directly by the interpreter or `module` add up to the
+        # total, and everything else is counted in one of theirs
+        if len(indent) == 1:
+            times[""] += cumulative
+
+    return times
+
+
+def run(repeat: int = 5, top: int = 5) -> List[Dict[str, Any]]:
+    """
+    Times the imports of each subcommand in `SUBCOMMAND_MODULES`, keeping the
+    fastest of each.
+
+    Parameters:
+        repeat (int): how many times to import each subcommand. Default is 5
+        top (int): how many of the slowest imports to keep. Default is 5
+
+    Returns:
+        results (List[Dict[str, Any]]): the total import time of each
+            subcommand in seconds, with its slowest top level packages
+    """
+    results = []
+    for subcommand, module in SUBCOMMAND_MODULES.items():
+        times = min((import_times(module) for _ in range(repeat)), key=lambda t: t[""])
+        slowest = sorted(
+            (
+                name
+                for name in times
+                if name and "." not in name and name not in ("src", module)
+            ),
+            key=lambda name: -times[name],
+        )[:top]
+        results.append(
+            {
+                "subcommand": subcommand,
+                "module": module,
+                "seconds": times[""] / 1e6,
+                "slowest": {name: times[name] / 1e6 for name in slowest},
+            }
+        )
+        print(
+            f"{subcommand:>5} {times[''] / 1e3:8.1f}ms  "
+            + ", ".join(f"{name} {times[name] / 1e3:.0f}ms" for name in slowest)
+        )
+
+    return results
+
+
+def main() -> None:
+    """
+    Runs the benchmark with the command line arguments, optionally writing the
+    results as JSON.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    args = _parse_args()
+    results = run(args.repeat, args.top)
+    if args.output is not None:
+        with open(args.output, "w") as out:
+            json.dump({"results": results}, out, indent=2)
+
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+from os.path import splitext
+from typing import Dict, NamedTuple, Tuple
+
+from src.read_data.column import Column
+
+
+class CategoryProfile(NamedTuple):
+    """
+    How transactions in one category look.
+
+    Attributes:
+        weight (float): how likely a transaction is to be in the category
+        is_food (bool): whether the category is food
+        controllable (float): the chance a transaction in it is controllable
+        price (Tuple[float, float]): the shape and scale of the gamma
+            distribution prices are drawn from
+        descriptions (Tuple[str, ...]): the descriptions to choose from
+    """
+
+    weight: float
+    is_food: bool
+    controllable: float
+    price: Tuple[float, float]
+    descriptions: Tuple[str, ...]
+
+
+CATEGORIES: Dict[str, CategoryProfile] = {
+    "Groceries": CategoryProfile(
+        0.30, True, 0.2, (3.0, 15.0), ("Groceries", "Farmers Market", "Bakery")
+    ),
+    "Eating Out": CategoryProfile(
+        0.20, True, 0.9, (2.0, 12.0), ("Lunch", "Dinner", "Coffee", "Takeout")
+    ),
+    "Car": CategoryProfile(0.10, False, 0.1, (2.5, 18.0), ("Gas", "Parking", "Wash")),
+    "Household": CategoryProfile(
+        0.12, False, 0.6, (1.5, 20.0), ("Cleaning", "Furniture", "Tools")
+    ),
+    "Recreation": CategoryProfile(
+        0.12, False, 0.95, (1.5, 25.0), ("Movies", "Concert", "Games", "Books")
+    ),
+    "Beauty": CategoryProfile(0.06, False, 0.8, (2.0, 15.0), ("Haircut", "Cosmetics")),
+    "Gifts": CategoryProfile(0.05, False, 1.0, (2.0, 20.0), ("Birthday", "Holiday")),
+    "Medical": CategoryProfile(0.05, False, 0.0, (1.2, 60.0), ("Pharmacy", "Doctor")),
+}
+
+# the bills paid at the start of every month, with their usual amounts
+BILLS = {
+    "Rent": 1500.0,
+    "Power": 90.0,
+    "Water": 45.0,
+    "Internet": 60.0,
+    "Phone": 40.0,
+}
+
+# the chance that a transaction is a rare, large one-off expense
+LARGE_EXPENSE_RATE = 0.001
+
+
+def synthetic_ledger(
+    rows: int,
+    seed: int = 0,
+    year: int = 2024,
+    descriptions: bool = True,
+    years: int = 1,
+) -> pd.DataFrame:
+    """
+    Generates years of made up transactions that look like a real spreadsheet,
+    before the schema is applied. Categories are skewed towards groceries and
+    eating out, every month starts with the same `BILLS`, and a few transactions
+    are large one-off expenses. The same arguments always give the same ledger.
+
+    Parameters:
+        rows (int): how many transactions to generate, including the bills
+        seed (int): the seed of the random number generator. Default is 0
+        year (int): which year the transactions start in. Default is 2024
+        descriptions (bool): whether to include a Description column. Default
+            is True
+        years (int): how many years the transactions are spread over, starting
+            with `year`. Default is 1
+
+    Returns:
+        ledger (DataFrame): the transactions, sorted by date, with the columns
+            of `SCHEMA` and optionally a Description column
+    """
+    rng = np.random.default_rng(seed)
+    first_day = pd.Timestamp(f"{year}-01-01")
+    month_starts = pd.date_range(first_day, periods=12 * years, freq="MS")
+    num_bills = min(rows, len(month_starts) * len(BILLS))
+
+    bill_names = np.tile(list(BILLS), len(month_starts))[:num_bills]
+    bills = pd.DataFrame(
+        {
+            Column.DATE: np.repeat(month_starts, len(BILLS))[:num_bills],
+            "Description": bill_names,
+            Column.CATEGORY: "Bills",
+            Column.PRICE: np.round(
+                np.array([BILLS[b] for b in bill_names])
+                * rng.uniform(0.9, 1.1, num_bills),
+                2,
+            ),
+            Column.IS_FOOD: 0,
+            Column.CONTROLLABLE: 0,
+        }
+    )
+
+    n = rows - num_bills
+    names = np.array(list(CATEGORIES))
+    weights = np.array([c.weight for c in CATEGORIES.values()])
+    codes = rng.choice(len(names), n, p=weights / weights.sum())
+    profiles = [CATEGORIES[name] for name in names]
+
+    shapes = np.array([p.price[0] for p in profiles])[codes]
+    scales = np.array([p.price[1] for p in profiles])[codes]
+    prices = rng.gamma(shapes, scales) + 0.5
+    large = rng.random(n) < LARGE_EXPENSE_RATE
+    prices[large] = rng.uniform(1000, 5000, large.sum())
+
+    # every category's descriptions end to end, so they can be picked by index
+    all_descriptions = np.array([d for p in profiles for d in p.descriptions])
+    counts = np.array([len(p.descriptions) for p in profiles])
+    offsets = np.cumsum(counts) - counts
+
+    days = (pd.Timestamp(f"{year + years - 1}-12-31") - first_day).days + 1
+    spending = pd.DataFrame(
+        {
+            Column.DATE: first_day
+            + pd.to_timedelta(rng.integers(0, days, n), unit="D"),
+            "Description": all_descriptions[
+                offsets[codes] + rng.integers(0, 1 << 16, n) % counts[codes]
+            ],
+            Column.CATEGORY: names[codes],
+            Column.PRICE: np.round(prices, 2),
+            Column.IS_FOOD: np.array([p.is_food for p in profiles], dtype=int)[codes],
+            Column.CONTROLLABLE: (
+                rng.random(n) < np.array([p.controllable for p in profiles])[codes]
+            ).astype(int),
+        }
+    )
+
+    ledger = (
+        pd.concat([bills, spending], ignore_index=True)
+        .sort_values(Column.DATE, kind="stable")
+        .reset_index(drop=True)
+    )
+    if not descriptions:
+        ledger = ledger.drop(columns="Description")
+
+    return ledger
+
+
+def write_ledger(ledger: pd.DataFrame, path: str) -> None:
+    """
+    Writes a ledger from `synthetic_ledger` to a spreadsheet that `read_data`
+    can read. The type of spreadsheet is taken from the extension of `path`.
+
+    Parameters:
+        ledger (DataFrame): the ledger to write
+        path (str): where to write it. Must end in .csv, .txt or .xlsx
+
+    Returns:
+        None
+    """
+    extn = splitext(path)[1]
+    if extn in (".csv", ".txt"):
+        ledger.to_csv(path, index=False, date_format="%Y-%m-%d")
+
+    elif extn == ".xlsx":
+        ledger.to_excel(path, sheet_name="Sheet1", index=False)
+
+    else:
+        raise ValueError(f"Can't write a ledger to a {extn} file.")
@@ -0,0 +1,23 @@
+import numpy as np
+from time import perf_counter
+from typing import Callable
+
+
+def best_time(func: Callable[[], object], repeat: int = 3) -> float:
+    """
+    Returns the fastest of `repeat` runs of `func`, in seconds.
+
+    Parameters:
+        func (Callable[[], object]): the function to time
+        repeat (int): how many times to run it. Default is 3
+
+    Returns:
+        seconds (float): how long the fastest run took
+    """
+    best = np.inf
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+
+    return best
@@ -1,17 +1,22 @@
 import sys
 
-from src.analyze_spending import analyze_spending
-from src.drivers.ui.ui_driver import UIDriver
-from src.initialize import initialize
 from src.utilities.parse_args import parse_args, Subcommand
 
 if __name__ == "__main__":
+    # each subcommand is imported only when it's run, so that e.g. init doesn't
+    # have to load the plotting libraries
     cmd = parse_args().subparser_name
     if cmd == Subcommand.INIT:
+        from src.initialize import initialize
+
         initialize()
     elif cmd == Subcommand.CLI:
+        from src.analyze_spending import analyze_spending
+
         analyze_spending()
     elif cmd == Subcommand.UI:
+        from src.drivers.ui.ui_driver import UIDriver
+
         UIDriver().mainloop()
     else:
         raise ValueError(f"Invalid subcommand {sys.argv[1]}")
@@ -1,26 +1,117 @@
-from datetime import datetime
+import pandas as pd
+from os.path import join
+from time import perf_counter
 
-from src.drivers.visualization_driver import VisualizationDriver
 from src.drivers.aggregation_driver import AggregationDriver
 from src.drivers.validation_driver import ValidationDriver
+from src.models.paths import Paths
+from src.read_data.date_format import DATE_PARSING_ATTR
+from src.read_data.read_data import append_data, disable_cache, read_data
+from src.read_data.write_data import compact_journal
+from src.utilities.parse_args import parse_args, Subcommand
+from src.utilities.metrics import metric_stats, reset_metric_stats
+from src.utilities.progress import report_progress
+from src.utilities.profiling import (
+    enable_profiling,
+    profiling_enabled,
+    stage,
+    write_profile,
+)
 
 
 def analyze_spending(verbose: bool = True) -> None:
     """
-    Runs the visualization script and performs aggregations.
+    Runs the visualization script and performs aggregations. When reading the
+    spreadsheet in chunks, only the aggregations are performed, and the
+    validations are run on each chunk as it's read. With `--profile`, the time
+    and memory taken by each stage is written to `profile.json` next to the
+    aggregations.
 
     Parameters:
+        verbose (bool): whether to print the time taken, how the dates were
+            parsed and how often each metric was reused. Default is True
+
+    Returns:
+        None
+    """
+    start = perf_counter()
+    reset_metric_stats()
+    cli = parse_args().subparser_name == Subcommand.CLI
+    chunked = cli and parse_args().chunk_size is not None
+    if cli and parse_args().no_cache:
+        disable_cache()
+
+    if cli and parse_args().profile:
+        enable_profiling()
+
+    if cli and parse_args().compact_journal:
+        compact_journal(Paths.spending_path())
+
+    with stage("analyze_spending", "run"):
+        if not chunked:
+            report_progress("Reading the spreadsheet...")
+            with stage("read_data", "read"):
+                spending = read_data(Paths.spending_path())
+                Paths.infer_year(spending)
+
+            report_progress("Validating...")
+            with stage("validate", "stage"):
+                ValidationDriver().validate_spending()
+
+            # the plotting libraries are only loaded when there's something to plot
+            with stage("import visualizations", "stage"):
+                from src.drivers.visualization_driver import VisualizationDriver
+
+            with stage("visualize", "stage"):
+                VisualizationDriver().visualize()
+
+        report_progress("Aggregating...")
+        with stage("aggregate", "stage"):
+            AggregationDriver().aggregate()
+
+    if profiling_enabled():
+        profile_path = join(Paths.this_years_data(), "profile.json")
+        write_profile(profile_path, parse_args().trace_file)
+        if verbose:
+            print(f"Wrote profile to {profile_path}.")
+
+    if verbose and not chunked:
+        print(f"Parsed dates as {spending.attrs.get(DATE_PARSING_ATTR)}.")
+
+    if verbose:
+        for name, stats in metric_stats().items():
+            print(f"{name}: computed {stats.misses} times, reused {stats.hits} times")
+
+        print(f"Completed in {round(perf_counter() - start, 2)} seconds.")
+
+
+def analyze_appended(rows: pd.DataFrame, verbose: bool = True) -> None:
+    """
+    Appends transactions to this year's spreadsheet and brings the plots and
+    aggregations up to date. The typed data from the last run is reused with the
+    new rows added to it, and only the plots of the months the rows are in and
+    the combined plots are rendered again, since the other months haven't
+    changed.
+
+    Parameters:
+        rows (DataFrame): the transactions to append, with the spreadsheet's
+            columns
         verbose (bool): whether to print the time taken. Default is True
 
     Returns:
         None
     """
-    start = datetime.now()
+    start = perf_counter()
+    report_progress("Adding the transaction...")
+    append_data(rows, Paths.spending_path())
+    report_progress("Validating...")
     ValidationDriver().validate_spending()
+
+    from src.drivers.visualization_driver import VisualizationDriver
+
     VisualizationDriver().visualize()
+    report_progress("Aggregating...")
     AggregationDriver().aggregate()
+
     if verbose:
-        print(
-            f"Completed in {round((datetime.now() - start).microseconds / 1e5, 2)}"
-            + " seconds."
-        )
+        print(f"Completed in {round(perf_counter() - start, 2)} seconds.")
@@ -6,8 +6,10 @@ from src.utilities.helpers import monthly_income
 from src.models.paths import Paths
 from src.read_data.column import Column
 from src.models.day_counts import DayCounts
+from src.utilities.metrics import metric
 
 
+@metric()
 def estimated_income_after_tax(df: pd.DataFrame) -> float:
     """
     Returns the estimated income over the course of the data in
@@ -2,8 +2,10 @@ import pandas as pd
 from typing import Tuple
 
 from src.calculations.expenses_split import expenses_split
+from src.utilities.metrics import metric
 
 
+@metric(expenses_split)
 def income_split(
     df: pd.DataFrame,
 ) -> Tuple[Tuple[str, str], Tuple[str, str], Tuple[str, str]]:
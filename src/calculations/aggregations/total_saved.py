@@ -4,8 +4,10 @@ from src.calculations.aggregations.estimated_income_after_tax import (
     estimated_income_after_tax,
 )
 from src.calculations.aggregations.total_spent import total_spent
+from src.utilities.metrics import metric
 
 
+@metric(estimated_income_after_tax, total_spent)
 def total_saved(df: pd.DataFrame) -> float:
     """
     Returns the total amount saved.
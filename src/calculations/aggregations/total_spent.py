@@ -2,8 +2,10 @@ import pandas as pd
 from typing import cast
 
 from src.read_data.column import Column
+from src.utilities.metrics import metric
 
 
+@metric()
 def total_spent(df: pd.DataFrame) -> float:
     """
     Returns how much money was spent in total.
@@ -4,6 +4,7 @@ from typing import Dict
 from src.utilities.helpers import monthly_income
 from src.read_data.column import Column
 from src.models.day_counts import DayCounts
+from src.calculations.daily_rollup import daily_rollup
 
 
 def category_spending(df: pd.DataFrame) -> Dict[str, float]:
@@ -12,18 +13,20 @@ def category_spending(df: pd.DataFrame) -> Dict[str, float]:
     spent in total and how much was made in that period.
 
     Parameters:
-        df (DataFrame): the Pandas DataFrame to analyze
+        df (DataFrame): the Pandas DataFrame to analyze. Can also be its
+            `daily_rollup`
 
     Returns:
         categories (Dict[str, float]): mapping from category name to how much
             was spent on that category
     """
-    totals = df.groupby([Column.CATEGORY])[Column.PRICE].sum()
+    rollup = daily_rollup(df)
+    totals = rollup.groupby([Column.CATEGORY], observed=True)[Column.PRICE].sum()
 
     # we add one so the range is inclusive of both ends
-    num_days = (df[Column.DATE].max() - df[Column.DATE].min()).days + 1
+    num_days = (rollup[Column.DATE].max() - rollup[Column.DATE].min()).days + 1
     prorated_income = num_days * monthly_income() / DayCounts.days_per_month()
 
     x = list(totals.index) + ["Total spent", "Income"]
-    y = list(totals.values) + [df[Column.PRICE].sum(), prorated_income]
+    y = list(totals.values) + [rollup[Column.PRICE].sum(), prorated_income]
     return dict(zip(x, y))
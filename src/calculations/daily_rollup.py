@@ -0,0 +1,107 @@
+import pandas as pd
+from enum import StrEnum
+from typing import Dict, Iterable
+
+from src.read_config.get_config import get_config
+from src.read_data.column import Column
+from src.utilities.decorators import cache_by_frame
+from src.utilities.df_common import projected_bills
+
+
+class RollupColumn(StrEnum):
+    COUNT = "Count"
+    BILL_PRICE = "Bill Price"
+    BILL_COUNT = "Bill Count"
+
+
+ROLLUP_KEYS = [Column.DATE, Column.CATEGORY, Column.IS_FOOD, Column.CONTROLLABLE]
+
+
+def daily_rollup(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sums up the transactions in df by day, category, whether they're food and
+    whether they're controllable. The rollup is built once per DataFrame and has
+    the same Date, Category, Is Food, Controllable and Price columns as df, so
+    anything that only needs those columns can use it instead of df. On top of
+    those, it counts the transactions in each row and keeps track of how much of
+    each row is projected bills (see `projected_bills`). Since which bills are
+    projected depends on the config, the rollup is rebuilt if the config changes.
+
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to roll up. If it is already a
+            rollup, it is returned as is
+
+    Returns:
+        rollup (DataFrame): the daily totals, sorted by date
+    """
+    if RollupColumn.COUNT in df.columns:
+        return df
+
+    rollups = _frame_rollups(df)
+    key = id(get_config())
+    if key not in rollups:
+        rollups[key] = _build_rollup(df)
+
+    return rollups[key]
+
+
+@cache_by_frame
+def _frame_rollups(df: pd.DataFrame) -> Dict[int, pd.DataFrame]:
+    """
+    Returns the rollups already built from df, by the identity of the config
+    they were built with.
+    """
+    return {}
+
+
+def _build_rollup(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Builds the rollup for `daily_rollup`.
+    """
+    bills = projected_bills(df)
+    keyed = pd.DataFrame(
+        {
+            Column.DATE: df[Column.DATE].dt.normalize(),
+            Column.CATEGORY: df[Column.CATEGORY],
+            Column.IS_FOOD: df[Column.IS_FOOD],
+            Column.CONTROLLABLE: df[Column.CONTROLLABLE],
+            Column.PRICE: df[Column.PRICE],
+            RollupColumn.BILL_PRICE: df[Column.PRICE].where(bills, 0.0),
+            RollupColumn.BILL_COUNT: bills.astype(int),
+        }
+    )
+
+    grouped = keyed.groupby(ROLLUP_KEYS, dropna=False, observed=True)
+    rollup = grouped[
+        [Column.PRICE, RollupColumn.BILL_PRICE, RollupColumn.BILL_COUNT]
+    ].sum()
+    rollup.insert(1, RollupColumn.COUNT, grouped.size())
+    return rollup.reset_index()
+
+
+def combine_rollups(rollups: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Combines the rollups of several DataFrames into the rollup of all of them
+    together, which lets the rollup be built a chunk at a time.
+
+    Parameters:
+        rollups (Iterable[DataFrame]): the rollups to combine, each from
+            `daily_rollup`
+
+    Returns:
+        rollup (DataFrame): the combined daily totals, sorted by date
+    """
+    stacked = pd.concat(list(rollups), ignore_index=True)
+    stacked[Column.CATEGORY] = stacked[Column.CATEGORY].astype("category")
+    return (
+        stacked.groupby(ROLLUP_KEYS, dropna=False, observed=True)[
+            [
+                Column.PRICE,
+                RollupColumn.COUNT,
+                RollupColumn.BILL_PRICE,
+                RollupColumn.BILL_COUNT,
+            ]
+        ]
+        .sum()
+        .reset_index()
+    )
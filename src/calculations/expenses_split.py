@@ -2,8 +2,10 @@ import pandas as pd
 from typing import Tuple
 
 from src.calculations.controllable_proportions import controllable_proportions
+from src.utilities.metrics import metric
 
 
+@metric(controllable_proportions)
 def expenses_split(df: pd.DataFrame) -> Tuple[float, float, float]:
     """
     Returns what percentage of expenses were not controllable, controllable,
@@ -1,12 +1,11 @@
-import numpy as np
 import pandas as pd
 from typing import Dict
-from datetime import date, timedelta
 
 from src.models.day_counts import DayCounts
-from src.utilities.helpers import time_filter
+from src.utilities.helpers import get_months
+from src.utilities.df_common import period_codes
 from src.read_data.column import Column
-from src.read_config.get_config import config_globals
+from src.calculations.daily_rollup import daily_rollup, RollupColumn
 
 
 def monthly_spending(df: pd.DataFrame) -> Dict[str, float]:
@@ -14,39 +13,56 @@ def monthly_spending(df: pd.DataFrame) -> Dict[str, float]:
     Calculates how much was spent each month in df.
 
     Parameters:
-        df (DataFrame): the Pandas DataFrame to analyze
+        df (DataFrame): the Pandas DataFrame to analyze. Can also be its
+            `daily_rollup`
 
     Returns:
         monthly_spending (Dict[str, float]): mapping from month name to
             how much was spent that month
     """
-    current: date = df[Column.DATE].min().date()
-    end: date = df[Column.DATE].max().date()
-    res = {}
-    fmt = "%m/%d/%Y"
-
-    while current <= end:
-        next_date = date(
-            current.year + int(current.month == DayCounts.months_per_year()),
-            (current.month % DayCounts.months_per_year()) + 1,
-            1,
-        ) - timedelta(days=1)
-
-        month_df = time_filter(df, current.strftime(fmt), next_date.strftime(fmt))
-
-        thresh = config_globals()["PROJECTED_SPENDING_BILL_THRESHOLD"]
-        filt_cond = (df[Column.CATEGORY] == "Bills") & (
-            df[Column.PRICE] >= (thresh if thresh >= 0 else np.inf)
-        )
+    rollup = daily_rollup(df)
+    dates = rollup[Column.DATE]
+    first_day = dates.min().normalize()
+    starts = get_months(first_day.date(), dates.max().date())
+
+    # each month is sampled from its first day, or the first day of data, up to
+    # but not including its last day
+    month_starts = pd.DatetimeIndex(starts)
+    window_starts = month_starts.where(month_starts > first_day, first_day)
+    window_ends = month_starts + pd.offsets.MonthEnd(0)
 
-        bills = month_df.loc[filt_cond][Column.PRICE].sum()
-        month_df = month_df.loc[~filt_cond]
+    codes = period_codes(dates, starts)
+    in_window = dates.to_numpy() < window_ends.to_numpy()[codes]
+    rows = rollup.loc[in_window]
+    row_codes = codes[in_window]
+    has_not_bills = (
+        rows[RollupColumn.COUNT] > rows[RollupColumn.BILL_COUNT]
+    ).to_numpy()
 
-        num_days = (month_df[Column.DATE].max() - month_df[Column.DATE].min()).days
-        spent = (month_df[Column.PRICE].sum() / num_days) * DayCounts.days_per_month()
-        spent += (bills / (next_date - current).days) * DayCounts.days_per_month()
+    totals = (
+        pd.DataFrame(
+            {
+                "bills": rows[RollupColumn.BILL_PRICE].to_numpy(),
+                "not_bills": (
+                    rows[Column.PRICE] - rows[RollupColumn.BILL_PRICE]
+                ).to_numpy(),
+            }
+        )
+        .groupby(row_codes)
+        .sum()
+        .reindex(range(len(starts)), fill_value=0.0)
+    )
+    spans = (
+        rows[Column.DATE]
+        .loc[has_not_bills]
+        .groupby(row_codes[has_not_bills])
+        .agg(["min", "max"])
+        .reindex(range(len(starts)))
+    )
 
-        res[current.strftime("%b")] = spent
-        current = next_date + timedelta(days=1)
+    num_days = (spans["max"] - spans["min"]).dt.days.to_numpy(dtype=float)
+    window_days = (window_ends - window_starts).days.to_numpy()
+    spent = (totals["not_bills"].to_numpy() / num_days) * DayCounts.days_per_month()
+    spent += (totals["bills"].to_numpy() / window_days) * DayCounts.days_per_month()
 
-    return res
+    return dict(zip(window_starts.strftime("%b"), spent.tolist()))
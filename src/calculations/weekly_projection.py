@@ -1,13 +1,14 @@
 import numpy as np
 import pandas as pd
 from typing import List
-from datetime import datetime, timedelta, date
+from datetime import timedelta
 
 from src.models.day_counts import DayCounts
-from src.utilities.helpers import get_weeks, time_filter
+from src.utilities.helpers import get_months, get_weeks
+from src.utilities.df_common import period_codes
 from src.read_data.column import Column
 from src.read_config.get_config import config_globals
-from src.utilities.df_common import group_by_month
+from src.calculations.daily_rollup import daily_rollup, RollupColumn
 
 
 def weekly_projection(df: pd.DataFrame) -> List[float]:
@@ -15,67 +16,61 @@ def weekly_projection(df: pd.DataFrame) -> List[float]:
     Finds the monthly spending projection for each week.
 
     Parameters:
-        df (DataFrame): the Pandas DataFrame to analyze
+        df (DataFrame): the Pandas DataFrame to analyze. Can also be its
+            `daily_rollup`
 
     Returns:
         week_spent (List[float]): how much was spent per week,
             projected as a per_month total
     """
-    fmt = "%m/%d/%Y"
-    one_week = timedelta(weeks=1)
-    all_dates = get_weeks(df[Column.DATE].min().date(), df[Column.DATE].max().date())
-    month_starts, month_dfs = group_by_month(df)
-
-    thresh = config_globals()["PROJECTED_SPENDING_BILL_THRESHOLD"]
-    filt_cond = (df[Column.CATEGORY] == "Bills") & (
-        df[Column.PRICE] >= (thresh if thresh > 0 else np.inf)
-    )
+    rollup = daily_rollup(df)
+    dates = rollup[Column.DATE]
+    first_day, last_day = dates.min().date(), dates.max().date()
+    weeks = get_weeks(first_day, last_day)
+    if len(weeks) == 0:
+        return []
 
-    monthly_bills = {}
-    for month_dtm, sub_df in zip(month_starts, month_dfs):
-        monthly_bills[month_dtm.strftime("%B")] = sub_df.loc[filt_cond]
-
-    df = df.loc[~filt_cond]
-
-    fmt = "%m/%d/%Y"
-    avgs = []
-    for i in range(len(all_dates)):
-        dtm = datetime.combine(all_dates[i], datetime.min.time())
-        week_df = time_filter(
-            df,
-            datetime.strftime(dtm, fmt),
-            datetime.strftime(dtm + one_week, fmt),
-        )
+    one_week = timedelta(weeks=1)
+    week_starts = pd.DatetimeIndex(weeks)
+    week_codes = period_codes(dates, weeks)
+    in_week = dates.to_numpy() < (week_starts + one_week).to_numpy()[week_codes]
+    rows = rollup.loc[in_week]
 
-        mo = dtm.strftime("%B")
-        if mo in monthly_bills:
-            week_df = week_df.loc[
-                ~week_df[Column.TRANSACTION_ID].isin(
-                    list(monthly_bills[mo][Column.TRANSACTION_ID])
-                )
-            ]
+    # unlike monthly_spending, a threshold of zero smooths no bills here
+    smooth_bills = config_globals()["PROJECTED_SPENDING_BILL_THRESHOLD"] != 0
+    bill_prices = rollup[RollupColumn.BILL_PRICE] * smooth_bills
+    bill_counts = rollup[RollupColumn.BILL_COUNT] * smooth_bills
 
-        if week_df.shape[0] == 0:
-            avgs.append(0.0)
-        else:
-            monthly_bill_smooth = monthly_bills[mo][Column.PRICE].sum() * (
-                DayCounts.days_per_month()
-                / (
-                    date(
-                        dtm.year + int(dtm.month == DayCounts.months_per_year()),
-                        (dtm.month % DayCounts.months_per_year()) + 1,
-                        1,
-                    )
-                    - timedelta(days=1)
-                ).day
-            )
+    not_bills_count = np.bincount(
+        week_codes[in_week],
+        weights=rows[RollupColumn.COUNT] - bill_counts[in_week],
+        minlength=len(weeks),
+    )
+    not_bills = np.bincount(
+        week_codes[in_week],
+        weights=rows[Column.PRICE] - bill_prices[in_week],
+        minlength=len(weeks),
+    )
 
-            avgs.append(
-                (
-                    (week_df[Column.PRICE].sum() / one_week.days)
-                    * DayCounts.days_per_month()
-                )
-                + monthly_bill_smooth
-            )
+    # bills are smoothed over the month each week starts in, joined by month name
+    months = get_months(first_day, last_day)
+    month_bills: pd.Series = pd.Series(
+        np.bincount(
+            period_codes(dates, months),
+            weights=bill_prices,
+            minlength=len(months),
+        ),
+        index=pd.DatetimeIndex(months).strftime("%B"),
+    )
+    month_bills = month_bills[~month_bills.index.duplicated(keep="last")]
+    monthly_bill_smooth = week_starts.strftime("%B").map(month_bills).to_numpy() * (
+        DayCounts.days_per_month() / week_starts.days_in_month.to_numpy()
+    )
 
-    return avgs
+    avgs = np.where(
+        not_bills_count == 0,
+        0.0,
+        ((not_bills / one_week.days) * DayCounts.days_per_month())
+        + monthly_bill_smooth,
+    )
+    return avgs.tolist()
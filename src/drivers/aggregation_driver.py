@@ -1,50 +1,121 @@
 import pandas as pd
+from os import makedirs
 from os.path import join
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.models.day_counts import DayCounts
 from src.models.paths import Paths
-from src.utilities.helpers import format_currency
-from src.read_data.read_data import read_data
-from src.read_config.custom_aggregations import custom_aggregations
+from src.utilities.currency import currency_formatter
+from src.read_data.read_data import read_csv_chunks, read_data
+from src.read_config.custom_aggregations import (
+    ChunkedAggregations,
+    custom_aggregations,
+)
+from src.calculations.daily_rollup import combine_rollups, daily_rollup
+from src.drivers.validation_driver import ValidationDriver
+from src.utilities.archive import archive_output
 from src.utilities.get_funcs_from_module import (
     get_funcs_from_module,
     get_modules_from_folder,
 )
 from src.read_data.column import Column
 from src.read_data.write_data import write_data
+from src.utilities.parse_args import parse_args, Subcommand
+from src.utilities.metrics import evaluation_order
+from src.utilities.profiling import profiled
 
 
 class AggregationDriver:
     """
     Class to perform all aggregations.
+
+    Attributes:
+        chunk_size (Optional[int]): how many rows of the spreadsheet to read at a
+            time, or None to read it all at once
     """
 
     num_days: int
+    chunk_size: Optional[int]
+
+    def __init__(self) -> None:
+        self.chunk_size = (
+            parse_args().chunk_size
+            if parse_args().subparser_name == Subcommand.CLI
+            else None
+        )
+
+    def _stream_spending(self, chunk_size: int) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Reads the spreadsheet a chunk at a time, validating each chunk and
+        building up the daily rollup and the custom aggregations as it goes.
+        """
+        validator = ValidationDriver()
+        customs = ChunkedAggregations()
+        rollup: Optional[pd.DataFrame] = None
+
+        for chunk in read_csv_chunks(
+            Paths.spending_path(), chunk_size, customs.columns()
+        ):
+            validator.validate(chunk)
+            customs.update(chunk)
+            chunk_rollup = daily_rollup(chunk)
+            rollup = (
+                chunk_rollup
+                if rollup is None
+                else combine_rollups([rollup, chunk_rollup])
+            )
+
+        if rollup is None:
+            raise ValueError("Validation error: empty spreadsheet.")
+
+        # catches problems that span chunks, like rows from different years
+        validator.validate(rollup)
+        return rollup, customs.result()
 
     def _get_aggs(self) -> Dict[str, Any]:
         """
-        Performs all the aggregations and formats them into a dictionary.
+        Performs all the aggregations and formats them into a dictionary. When
+        reading in chunks, the aggregations are passed the daily rollup of the
+        spreadsheet instead of the spreadsheet itself. Aggregations that are
+        metrics are evaluated after the metrics they use, so each is only
+        computed once.
         """
-        spending = read_data(Paths.spending_path())
+        if self.chunk_size is None:
+            spending = read_data(Paths.spending_path())
+            customs = custom_aggregations(spending)
+
+        else:
+            spending, customs = self._stream_spending(self.chunk_size)
+
         self.num_days = (spending[Column.DATE].max() - spending[Column.DATE].min()).days
         out = {}
 
         to_title = lambda s: s.replace("_", " ").title()
 
-        for path in get_modules_from_folder(
-            join("src", "calculations", "aggregations")
-        ):
-            for func in get_funcs_from_module(path):
-                agg_val = func(spending)
-                if hasattr(agg_val, "__iter__") and not isinstance(agg_val, str):
-                    for label, amount in agg_val:
-                        out[to_title(label)] = amount
+        funcs = [
+            func
+            for path in get_modules_from_folder(
+                join("src", "calculations", "aggregations")
+            )
+            for func in get_funcs_from_module(path)
+        ]
+        results = {}
+        for func in evaluation_order(funcs):
+            # metrics that are only used by the aggregations are profiled too,
+            # so each is timed where it's computed rather than where it's reused
+            call = func if func in funcs else profiled(func, "calculations")
+            results[func] = call(spending)
+
+        for func in funcs:
+            agg_val = results[func]
+            if hasattr(agg_val, "__iter__") and not isinstance(agg_val, str):
+                for label, amount in agg_val:
+                    out[to_title(label)] = amount
 
-                else:
-                    out[to_title(func.__name__)] = agg_val
+            else:
+                out[to_title(func.__name__)] = agg_val
 
-        for title, agg_val in custom_aggregations(spending).items():
+        for title, agg_val in customs.items():
             out[to_title(title)] = agg_val
 
         return out
@@ -55,7 +126,7 @@ class AggregationDriver:
         """
         if isinstance(val, float):
             if as_money:
-                return format_currency(val)
+                return currency_formatter().format(val)
 
             return str(round(val, 2))
 
@@ -113,4 +184,6 @@ class AggregationDriver:
             for col, val in to_add.items():
                 cols[col].append(val)
 
+        makedirs(Paths.this_years_data(), exist_ok=True)
         write_data(pd.DataFrame(cols), Paths.aggregation_path())
+        archive_output(Paths.aggregation_path())
@@ -1,28 +1,30 @@
-import pandas as pd
 import tkinter as tk
 from tkinter import filedialog as fd
 
 import sys
 from datetime import datetime, date
-from os import walk
-from os.path import join, relpath, splitext, exists
-from zipfile import ZipFile
+from os.path import exists
+from queue import Empty
+from threading import Thread
 import traceback as tb
 import re
 
-from typing import cast, Dict, Any, Callable
+from typing import cast, Dict, Any, Callable, List, Optional
 
-from src.analyze_spending import analyze_spending
-from src.read_data.read_data import read_data
 from src.models.paths import Paths, ALLOWED_EXTNS
 from src.read_data.column import Column
-from src.read_data.write_data import write_data
 from src.drivers.ui.color_scheme import ColorScheme
+from src.utilities.progress import Cancelled, Progress, report_progress, reporting_to
+
+# how often to check on work running in the background, in milliseconds
+POLL_INTERVAL = 100
 
 
 class UIDriver(tk.Tk):
     """
-    Class to run the UI.
+    Class to run the UI. The analysis and the libraries it needs are only
+    loaded once they're used, so that the window opens quickly, and they're run
+    on a worker thread, so that the window stays responsive.
     """
 
     def __init__(self) -> None:
@@ -40,12 +42,14 @@ class UIDriver(tk.Tk):
 
         self.padding = 10
         self.config(bg=ColorScheme.BACKGROUND)
+        self.progress: Optional[Progress] = None
 
         self._add_title_frame()
         self._add_input_frame()
 
         if exists(Paths.spending_path()):
-            self._add_output_frame()
+            # reading the spreadsheet is slow, so it's done once the window is up
+            self.after_idle(self._add_output_frame)
 
     def _add_title_frame(self) -> None:
         """
@@ -115,7 +119,17 @@ class UIDriver(tk.Tk):
         self.spending_sheet.config(
             command=lambda path=".": self.file_handler(path)  # type: ignore
         )
-        self.spending_sheet.pack(
+        self.spending_sheet.pack(padx=self.padding, pady=self.padding / 2)
+
+        self.cancel_button = tk.Button(
+            self.input_frame,
+            text="Cancel",
+            command=self.cancel,
+            state=tk.DISABLED,
+            fg=ColorScheme.BUTTON_TEXT,
+            bg=ColorScheme.ACCENT,
+        )
+        self.cancel_button.pack(
             padx=self.padding, pady=(self.padding / 2, self.padding)
         )
 
@@ -123,6 +137,8 @@ class UIDriver(tk.Tk):
         """
         Adds the output frame part of the UI.
         """
+        from src.read_data.read_data import read_data
+
         self.output_frame = tk.Frame(
             self,
             highlightbackground=ColorScheme.ACCENT,
@@ -192,6 +208,7 @@ class UIDriver(tk.Tk):
             self.output_frame,
             text="Add transaction",
             command=self.transaction_handler,
+            state=tk.NORMAL if self.progress is None else tk.DISABLED,
             fg=ColorScheme.BUTTON_TEXT,
             bg=ColorScheme.ACCENT,
         )
@@ -210,9 +227,98 @@ class UIDriver(tk.Tk):
         self.destroy()
         sys.exit(0)
 
+    def cancel(self) -> None:
+        """
+        Cancels the work running in the background, which stops at its next step.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        if self.progress is not None:
+            self.progress.cancelled.set()
+            self.info_label.config(text="Cancelling...")
+
+    def _set_inputs(self, enabled: bool) -> None:
+        """
+        Enables or disables everything that starts work in the background.
+        """
+        self.spending_sheet.config(state=tk.NORMAL if enabled else tk.DISABLED)
+        if hasattr(self, "transaction_submit"):
+            self.transaction_submit.config(state=tk.NORMAL if enabled else tk.DISABLED)
+
+    def _run_in_background(
+        self,
+        work: Callable[[], None],
+        on_done: Callable[[Optional[BaseException]], None],
+    ) -> None:
+        """
+        Runs `work` on a worker thread, showing the progress it reports until it
+        finishes. Then `on_done` is called on the main thread with the exception
+        `work` raised, or None if it succeeded. Only one piece of work runs at a
+        time, since the analysis and the paths it uses are shared, so the inputs
+        are disabled until it's done.
+        """
+        progress = Progress()
+        error: List[Optional[BaseException]] = [None]
+
+        def run() -> None:
+            import matplotlib
+
+            # only the Agg backend can draw plots off the main thread
+            matplotlib.use("Agg")
+            try:
+                with reporting_to(progress):
+                    work()
+
+            except Exception as e:
+                error[0] = e
+
+        def poll() -> None:
+            message = None
+            try:
+                while True:
+                    message = progress.events.get_nowait()
+
+            except Empty:
+                pass
+
+            if message is not None:
+                self.info_label.config(text=message)
+
+            if thread.is_alive():
+                self.after(POLL_INTERVAL, poll)
+                return
+
+            self.progress = None
+            self.cancel_button.config(state=tk.DISABLED)
+            self._set_inputs(True)
+            on_done(error[0])
+
+        self.progress = progress
+        self.cancel_button.config(state=tk.NORMAL)
+        self._set_inputs(False)
+        thread = Thread(target=run, daemon=True)
+        thread.start()
+        self.after(POLL_INTERVAL, poll)
+
+    def _show_error(self, error: BaseException) -> None:
+        """
+        Shows what went wrong in work that ran in the background.
+        """
+        if isinstance(error, Cancelled):
+            self.info_label.config(text="Cancelled.")
+            return
+
+        self.info_label.config(text=f"Something went wrong: {str(error)}")
+        print("".join(tb.format_exception(error)))
+
     def file_handler(self, path: str) -> None:
         """
-        Processes the files and creates the plots and aggregations.
+        Processes the files and creates the plots and aggregations in the
+        background, adding them to an archive as they're made.
 
         Parameters:
             path (str): the path to the spreadsheet
@@ -220,6 +326,9 @@ class UIDriver(tk.Tk):
         Returns:
             None
         """
+        if self.progress is not None:
+            return
+
         self.info_label.config(text="...processing data...")
         refs = fd.askopenfilename(
             parent=self,
@@ -227,51 +336,54 @@ class UIDriver(tk.Tk):
             initialdir=path,
             filetypes=(("spreadsheets", ["*" + e for e in ALLOWED_EXTNS]),),
         )
-
-        try:
-            df = read_data(refs)
-            new_year = cast(datetime, df[Column.DATE].median()).year
-            Paths._year_mut[0] = new_year
-            Paths._sheet_override[0] = refs
-
-            analyze_spending(verbose=False)
-        except Exception as e:
-            self.info_label.config(text=f"Something went wrong: {str(e)}")
-            print(tb.format_exc())
+        if not refs:
+            self.info_label.config(text="")
             return
 
-        self.info_label.config(text="Processing complete! Archiving data...")
-
-        try:
-            out_name = fd.asksaveasfilename(
-                filetypes=[("Archive Files", "*.zip")], defaultextension=".zip"
-            )
+        out_name = fd.asksaveasfilename(
+            filetypes=[("Archive Files", "*.zip")], defaultextension=".zip"
+        )
+        if not out_name:
+            self.info_label.config(text="")
+            return
 
-            with ZipFile(out_name, "w") as archive:
+        self._run_in_background(lambda: self._analyze(refs, out_name), self._analyzed)
 
-                def add_file(add_path: str) -> None:
-                    archive_path = relpath(add_path, Paths.this_years_data())
-                    archive.write(add_path, archive_path)
+    def _analyze(self, path: str, out_name: str) -> None:
+        """
+        Analyzes the spreadsheet at `path`, writing the outputs to the zip file
+        at `out_name`. Runs on a worker thread.
+        """
+        from src.analyze_spending import analyze_spending
+        from src.read_data.read_data import read_data
+        from src.utilities.archive import ArchiveWriter, archiving_to
 
-                add_file(Paths.aggregation_path())
+        df = read_data(path)
+        new_year = cast(datetime, df[Column.DATE].median()).year
+        Paths._year_mut[0] = new_year
+        Paths._sheet_override[0] = path
 
-                for dir_path, _, file_names in walk(Paths.this_years_data()):
-                    for file in file_names:
-                        if splitext(file)[1] not in ALLOWED_EXTNS:
-                            add_file(join(dir_path, file))
+        with ArchiveWriter(out_name, Paths.this_years_data()) as archive:
+            with archiving_to(archive):
+                analyze_spending(verbose=False)
 
-            self.info_label.config(text="Archive created!")
+            report_progress("Archiving...")
+            archive.add_tree()
 
-        except Exception as e:
-            self.info_label.config(
-                text=f"Something went wrong saving the zip file: {e}"
-            )
-            print(tb.format_exc())
+    def _analyzed(self, error: Optional[BaseException]) -> None:
+        """
+        Shows whether the analysis and the archive succeeded.
+        """
+        if error is not None:
+            self._show_error(error)
             return
 
+        self.info_label.config(text="Processing complete! Archive created!")
+
     def transaction_handler(self) -> None:
         """
-        Validates and writes transaction input.
+        Validates and writes transaction input, then updates the plots and
+        aggregations of the months it changed in the background.
 
         Parameters:
             None
@@ -279,6 +391,13 @@ class UIDriver(tk.Tk):
         Returns:
             None
         """
+        if self.progress is not None:
+            return
+
+        import pandas as pd
+
+        from src.analyze_spending import analyze_appended
+
         flag_converter = lambda s: 1 if s == "True" else 0
         converters: Dict[str, Callable[[str], Any]] = {
             Column.DATE: lambda s: datetime.strptime(s, self.fmt).date(),
@@ -296,8 +415,22 @@ class UIDriver(tk.Tk):
                 self.info_label.config(text=f"Invalid value for {col}: '{val}'")
                 return
 
-        Paths._year_mut[0] = cols[Column.DATE][0].year
-        write_data(pd.DataFrame(cols), Paths.spending_path(), mode="a")
+        rows = pd.DataFrame(cols)
+
+        def work() -> None:
+            Paths._year_mut[0] = cols[Column.DATE][0].year
+            analyze_appended(rows, verbose=False)
+
+        self._run_in_background(work, self._transaction_added)
+
+    def _transaction_added(self, error: Optional[BaseException]) -> None:
+        """
+        Shows whether the transaction was added, clearing the inputs if it was.
+        """
+        if error is not None:
+            self._show_error(error)
+            return
+
         self.info_label.config(text=f"Transaction added to {Paths.spending_path()}")
 
         for col, var in self.transaction_vars.items():
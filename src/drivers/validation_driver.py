@@ -1,3 +1,4 @@
+import pandas as pd
 from os.path import join
 
 from src.read_data.read_data import read_data
@@ -24,8 +25,18 @@ class ValidationDriver:
         Returns:
             None
         """
-        df = read_data(Paths.spending_path())
+        self.validate(read_data(Paths.spending_path()))
 
+    def validate(self, df: pd.DataFrame) -> None:
+        """
+        Performs all checks in the `validations` directory on df.
+
+        Parameters:
+            df (DataFrame): the spending, or a chunk of it
+
+        Returns:
+            None
+        """
         for mod in get_modules_from_folder(join("src", "read_data", "validations")):
             for func in get_funcs_from_module(mod):
                 func(df)
@@ -1,17 +1,230 @@
+import hashlib
+import matplotlib
+import matplotlib.pyplot as plt
 import pandas as pd
-from os import makedirs
-from os.path import join
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from os import listdir, makedirs, replace
+from os.path import exists, join, relpath
+from shutil import rmtree
+from tempfile import mkdtemp
+from typing import Callable, Dict, List, Optional, Tuple
 
 from src.models.paths import Paths
 from src.read_data.read_data import read_data, get_month_dfs
+from src.utilities.archive import archive_output
 from src.utilities.get_funcs_from_module import (
     get_funcs_from_module,
     get_modules_from_folder,
 )
+from src.utilities.parse_args import parse_args, Subcommand
+from src.utilities.progress import Cancelled, report_progress
+from src.utilities.profiling import (
+    Span,
+    add_spans,
+    enable_profiling,
+    profiling_enabled,
+    take_spans,
+)
 from src.read_data.column import Column
 
 from src.read_config.plotters_from_config import plotters_from_config, Plotter
+from src.visualizations.figure_reuse import (
+    disable_figure_reuse,
+    enable_figure_reuse,
+    figure_reuse_enabled,
+)
+from src.visualizations.plot_manifest import (
+    frame_hash,
+    load_manifest,
+    plotter_hash,
+    plotter_name,
+    save_manifest,
+)
+
+WorkItem = Tuple[Plotter, pd.DataFrame, str]
+
+# the DataFrames a worker process renders plots of, sent once when it starts
+_worker_frames: List[pd.DataFrame] = []
+
+
+def _render(plotter: Plotter, df: pd.DataFrame, out_dir: str) -> None:
+    """
+    Calls one plotter, starting and ending with no open figures so that the
+    plot doesn't depend on which plotters ran before it.
+    """
+    plt.close("all")
+    plotter(df, out_dir)
+    plt.close("all")
+
+
+def _render_in_worker(plotter: Plotter, frame: int, out_dir: str) -> List[Span]:
+    """
+    Calls `_render` in a worker process on one of the DataFrames it was sent,
+    returning the spans it recorded so they can be added to the main process's.
+    """
+    _render(plotter, _worker_frames[frame], out_dir)
+    return take_spans()
+
+
+def _init_worker(
+    year: int,
+    sheet_override: str,
+    profile: bool,
+    reuse_figures: bool,
+    frames: List[pd.DataFrame],
+) -> None:
+    """
+    Sets up a worker process to render plots of `frames` the same way the main
+    process would.
+    """
+    matplotlib.use("Agg")
+    _worker_frames[:] = frames
+    Paths._year_mut[0] = year
+    Paths._sheet_override[0] = sheet_override
+    if profile:
+        enable_profiling()
+
+    if reuse_figures:
+        enable_figure_reuse()
+
+
+def render_plots(
+    items: List[WorkItem],
+    jobs: int = 1,
+    on_rendered: Optional[Callable[[int], None]] = None,
+) -> None:
+    """
+    Calls each plotter on its DataFrame and output directory. If `jobs` is more
+    than one, the plots are rendered by that many worker processes, each being
+    sent every distinct DataFrame once when it starts, rather than once per
+    plotter. The plots are the same either way.
+
+    Parameters:
+        items (List[WorkItem]): a list of (plotter, DataFrame, out_dir) tuples
+        jobs (int): how many processes to render the plots with. Default is 1,
+            which renders them in this process
+        on_rendered (Optional[Callable[[int], None]]): called with the index of
+            each item once its plots are written, in order. Default is None
+
+    Returns:
+        None
+    """
+    if jobs <= 1:
+        for i, item in enumerate(items):
+            report_progress(f"Plotting {i + 1} of {len(items)}...")
+            _render(*item)
+            if on_rendered is not None:
+                on_rendered(i)
+
+        return
+
+    frames = list({id(df): df for _, df, _ in items}.values())
+    positions = {id(df): i for i, df in enumerate(frames)}
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(
+            Paths.get_year(),
+            Paths._sheet_override[0],
+            profiling_enabled(),
+            figure_reuse_enabled(),
+            frames,
+        ),
+    ) as pool:
+        futures = [
+            pool.submit(_render_in_worker, plotter, positions[id(df)], out_dir)
+            for plotter, df, out_dir in items
+        ]
+        try:
+            for i, future in enumerate(futures):
+                report_progress(f"Plotting {i + 1} of {len(items)}...")
+                add_spans(future.result())
+                if on_rendered is not None:
+                    on_rendered(i)
+
+        except Cancelled:
+            for future in futures:
+                future.cancel()
+
+            raise
+
+
+def render_changed(
+    items: List[WorkItem], plots_dir: str, jobs: int = 1, force: bool = False
+) -> int:
+    """
+    Renders the plots with `render_plots`, skipping any whose data, plotter and
+    config haven't changed since they were last rendered into `plots_dir`, as
+    recorded in its manifest. Plots are rendered into a staging directory and
+    moved into place once they're all done, so the manifest only ever records
+    images that were completely written. Each plot is added to the archive being
+    written, if there is one, as soon as it's rendered or found to be unchanged.
+
+    Parameters:
+        items (List[WorkItem]): a list of (plotter, DataFrame, out_dir) tuples,
+            where each out_dir is in `plots_dir`
+        plots_dir (str): the directory the plots and the manifest are in
+        jobs (int): how many processes to render the plots with. Default is 1
+        force (bool): whether to render every plot, even if it hasn't changed.
+            Default is False
+
+    Returns:
+        rendered (int): how many of the items were rendered
+    """
+    manifest = load_manifest(plots_dir)
+    frame_hashes: Dict[int, str] = {}
+    plotter_hashes: Dict[int, str] = {}
+    staging = mkdtemp(prefix=".staging", dir=plots_dir)
+    try:
+        staged: List[WorkItem] = []
+        changed: List[Tuple[str, str, str, str]] = []
+        for plotter, df, out_dir in items:
+            if id(df) not in frame_hashes:
+                frame_hashes[id(df)] = frame_hash(df)
+
+            if id(plotter) not in plotter_hashes:
+                plotter_hashes[id(plotter)] = plotter_hash(plotter)
+
+            key = f"{relpath(out_dir, plots_dir)}/{plotter_name(plotter)}"
+            digest = hashlib.sha256(
+                (frame_hashes[id(df)] + plotter_hashes[id(plotter)]).encode()
+            ).hexdigest()
+            entry = manifest.get(key)
+            if (
+                not force
+                and entry is not None
+                and entry["hash"] == digest
+                and all(exists(join(out_dir, image)) for image in entry["images"])
+            ):
+                for image in entry["images"]:
+                    archive_output(join(out_dir, image))
+
+                continue
+
+            stage_dir = join(staging, str(len(staged)))
+            makedirs(stage_dir)
+            staged.append((plotter, df, stage_dir))
+            changed.append((key, digest, out_dir, stage_dir))
+
+        def archive_staged(i: int) -> None:
+            _, _, out_dir, stage_dir = changed[i]
+            for image in sorted(listdir(stage_dir)):
+                archive_output(join(stage_dir, image), join(out_dir, image))
+
+        render_plots(staged, jobs, archive_staged)
+        for key, digest, out_dir, stage_dir in changed:
+            images = sorted(listdir(stage_dir))
+            for image in images:
+                replace(join(stage_dir, image), join(out_dir, image))
+
+            manifest[key] = {"hash": digest, "images": images}
+
+        save_manifest(plots_dir, manifest)
+
+    finally:
+        rmtree(staging, ignore_errors=True)
+
+    return len(staged)
 
 
 class VisualizationDriver:
@@ -21,14 +234,26 @@ class VisualizationDriver:
     Attributes:
         monthlys (List[Plotter]): the plotters to call each month
         yearlys (List[Plotters]): the plotters to call each year
+        jobs (int): how many processes to render the plots with
+        reuse_figures (bool): whether each chart's figure is built once and
+            reused for every month
+        force_render (bool): whether to render plots that haven't changed since
+            they were last rendered
     """
 
     monthlys: List[Plotter]
     yearlys: List[Plotter]
+    jobs: int
+    reuse_figures: bool
+    force_render: bool
 
     def __init__(self) -> None:
         makedirs(join(Paths.plots_dir(), "Combined"), exist_ok=True)
         self.monthlys, self.yearlys = plotters_from_config()
+        cli = parse_args().subparser_name == Subcommand.CLI
+        self.jobs = parse_args().jobs if cli else 1
+        self.reuse_figures = cli and parse_args().reuse_figures
+        self.force_render = cli and parse_args().force_render
 
         visualizers = join("src", "visualizations")
 
@@ -40,25 +265,11 @@ class VisualizationDriver:
             for func in get_funcs_from_module(mod):
                 self.yearlys.append(func)
 
-    def _plot_df(self, df: pd.DataFrame, out_dir: str) -> None:
-        """
-        Makes a bunch of plots for the dataframe and puts them in the `out_dir`
-        directory.
-
-        Parameters:
-            df (DataFrame): a Pandas DataFrame to plot
-            out_dir (str): the out_dir path to put the plots in
-
-        Returns:
-            None
-        """
-        for m in self.monthlys:
-            m(df, out_dir)
-
     def visualize(self) -> None:
         """
         Creates plots of all the spreadsheets. Main driver for
-        the visualizations.
+        the visualizations. Plots that haven't changed since the last run are
+        skipped, unless `--force-render` is passed.
 
         Parameters:
             None
@@ -67,18 +278,23 @@ class VisualizationDriver:
             None
         """
         all_dfs = read_data(Paths.spending_path())
-        months = get_month_dfs(all_dfs)
-        for df in months:
+        items: List[WorkItem] = []
+        for df in get_month_dfs(all_dfs):
             dates_in_df = list(df.sort_values(Column.DATE)[Column.DATE])
             month = dates_in_df[len(dates_in_df) // 2].strftime("%B")
             out_dir = join(Paths.plots_dir(), month)
             makedirs(out_dir, exist_ok=True)
-            self._plot_df(df, out_dir)
+            items.extend((m, df, out_dir) for m in self.monthlys)
 
         combined_path = join(Paths.plots_dir(), "Combined")
-        plot_funcs = [
-            self._plot_df,
-            *self.yearlys,
-        ]
-        for f in plot_funcs:
-            f(all_dfs, combined_path)
+        items.extend((m, all_dfs, combined_path) for m in self.monthlys)
+        items.extend((y, all_dfs, combined_path) for y in self.yearlys)
+
+        if self.reuse_figures:
+            enable_figure_reuse()
+
+        try:
+            render_changed(items, Paths.plots_dir(), self.jobs, self.force_render)
+
+        finally:
+            disable_figure_reuse()
@@ -1,9 +1,15 @@
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 from src.utilities.decorators import dataclass_from_json
 
 
+# functions whose value over a whole DataFrame can be found from their values over
+# its chunks
+CHUNKABLE_FUNCS = {"count", "sum", "prod", "min", "max", "any", "all", "mean"}
+
+
 @dataclass_from_json
 class AggFunction:
     """
@@ -36,3 +42,71 @@ class AggFunction:
             raise ValueError("Column must be provided.")
 
         return df[self.column].__getattr__(self.func)().item()
+
+    def partial(self, df: pd.DataFrame) -> Tuple[Any, int]:
+        """
+        Aggregates one chunk of a DataFrame, so that the chunks can be merged with
+        `merge` and turned into the value over the whole DataFrame with `finish`.
+
+        Parameters:
+            df (DataFrame): the filtered chunk to aggregate
+
+        Returns:
+            state (Tuple[Any, int]): the value over the chunk and how many values
+                it was found from
+        """
+        if self.func not in CHUNKABLE_FUNCS:
+            raise ValueError(f"{self.func} can't be aggregated a chunk at a time.")
+
+        if self.func == "count":
+            return df.shape[0], df.shape[0]
+
+        if self.column is None:
+            raise ValueError("Column must be provided.")
+
+        col = df[self.column]
+        value = col.sum() if self.func == "mean" else col.__getattr__(self.func)()
+
+        # empty columns give python scalars rather than numpy ones
+        return np.asarray(value).item(), int(col.count())
+
+    def merge(self, left: Tuple[Any, int], right: Tuple[Any, int]) -> Tuple[Any, int]:
+        """
+        Merges the states of two chunks from `partial`.
+
+        Parameters:
+            left (Tuple[Any, int]): the state of the first chunk
+            right (Tuple[Any, int]): the state of the second chunk
+
+        Returns:
+            state (Tuple[Any, int]): the state of both chunks together
+        """
+        if left[1] == 0 or right[1] == 0:
+            return left if right[1] == 0 else right
+
+        combiners: Dict[str, Callable[[Any, Any], Any]] = {
+            "count": lambda a, b: a + b,
+            "sum": lambda a, b: a + b,
+            "mean": lambda a, b: a + b,
+            "prod": lambda a, b: a * b,
+            "min": min,
+            "max": max,
+            "any": lambda a, b: a or b,
+            "all": lambda a, b: a and b,
+        }
+        return combiners[self.func](left[0], right[0]), left[1] + right[1]
+
+    def finish(self, state: Tuple[Any, int]) -> Any:
+        """
+        Turns the merged state of every chunk into the value of the aggregation.
+
+        Parameters:
+            state (Tuple[Any, int]): the merged state from `merge`
+
+        Returns:
+            agg_value (Any): the value of the aggregation
+        """
+        if self.func == "mean":
+            return state[0] / state[1] if state[1] else float("nan")
+
+        return state[0]
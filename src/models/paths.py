@@ -1,12 +1,16 @@
-from os import listdir
+from os import listdir, stat
 from os.path import splitext, join, basename
-from typing import cast, List
+from functools import lru_cache
+from time import time_ns
+from typing import cast, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 from src.utilities.parse_args import parse_args, Subcommand
-from src.read_data.read_data import read_data
 from src.read_data.column import Column
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 ALLOWED_EXTNS = {
     ".xlsx",
@@ -15,14 +19,36 @@ ALLOWED_EXTNS = {
     ".txt",
 }
 
+# how coarse directory modification times can be, e.g. on FAT or SMB
+MTIME_RESOLUTION_NS = 2_000_000_000
+
+
+def _year_from_file() -> bool:
+    """
+    Returns whether the year should be taken from the spreadsheet passed on the
+    command line.
+    """
+    return (
+        parse_args().subparser_name == Subcommand.CLI and parse_args().file is not None
+    )
+
 
 def _default_year() -> int:
     """
     Returns the year passed to the command on the command line, or the
-    system time's year if no year was passed.
+    system time's year if no year was passed. If a spreadsheet was passed
+    instead, it's read to find the year.
     """
     cmd = parse_args().subparser_name
-    if cmd == Subcommand.CLI and parse_args().file is not None:
+    if _year_from_file():
+        # only loaded here, since reading data needs pandas
+        from src.read_data.read_data import read_csv_chunks, read_data
+
+        if parse_args().chunk_size is not None:
+            # every row has the same year, so the first chunk is enough
+            first = next(read_csv_chunks(parse_args().file, parse_args().chunk_size))
+            return cast(datetime, first[Column.DATE].median()).year
+
         return cast(datetime, read_data(parse_args().file)[Column.DATE].median()).year
 
     if cmd in (Subcommand.CLI, Subcommand.INIT):
@@ -31,6 +57,29 @@ def _default_year() -> int:
     return datetime.now().year
 
 
+@lru_cache(maxsize=32)
+def _cached_listdir(parent: str, mtime: int) -> Tuple[str, ...]:
+    """
+    Returns the files in the given directory, cached by its modification time.
+    """
+    return tuple(listdir(parent))
+
+
+def _listdir(parent: str) -> Tuple[str, ...]:
+    """
+    Returns the files in the given directory, which are cached until the
+    directory is modified, i.e. until files are added to or removed from it. A
+    directory modified within `MTIME_RESOLUTION_NS` of now isn't cached, since a
+    file added in the same tick of a coarse clock wouldn't change its
+    modification time.
+    """
+    mtime = stat(parent).st_mtime_ns
+    if time_ns() - mtime < MTIME_RESOLUTION_NS:
+        return tuple(listdir(parent))
+
+    return _cached_listdir(parent, mtime)
+
+
 def _first_spreadsheet(parent: str, sheet_name: str) -> str:
     """
     Returns the path to the first spreadsheet with the given name in the given
@@ -39,7 +88,7 @@ def _first_spreadsheet(parent: str, sheet_name: str) -> str:
     try:
         return next(
             join(parent, f)
-            for f in listdir(parent)
+            for f in _listdir(parent)
             if splitext(basename(f))[0] == sheet_name
             and splitext(f)[1] in ALLOWED_EXTNS
         )
@@ -48,7 +97,9 @@ def _first_spreadsheet(parent: str, sheet_name: str) -> str:
 
 
 class Paths:
-    _year_mut: List[int] = [_default_year()]
+    # None until the year is first needed, so that importing this doesn't read
+    # the spreadsheet
+    _year_mut: List[Optional[int]] = [None]
     _sheet_override: List[str] = [""]
 
     @staticmethod
@@ -63,7 +114,27 @@ class Paths:
         Returns:
             year (int): which year to analyze
         """
-        return Paths._year_mut[0]
+        year = Paths._year_mut[0]
+        if year is None:
+            year = Paths._year_mut[0] = _default_year()
+
+        return year
+
+    @staticmethod
+    def infer_year(spending: "pd.DataFrame") -> None:
+        """
+        Takes the year from the spreadsheet passed on the command line once it's
+        been read, so that it doesn't have to be read again to find the year.
+        Does nothing if the year is already known or wasn't passed that way.
+
+        Parameters:
+            spending (DataFrame): the spending read from the spreadsheet
+
+        Returns:
+            None
+        """
+        if Paths._year_mut[0] is None and _year_from_file():
+            Paths._year_mut[0] = cast(datetime, spending[Column.DATE].median()).year
 
     @staticmethod
     def this_years_data() -> str:
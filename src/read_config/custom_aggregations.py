@@ -1,12 +1,28 @@
 import pandas as pd
-from functools import reduce
-from operator import __and__, __or__
 
-from typing import Any, Dict
+from typing import Any, Dict, Set, Tuple
 
 from src.models.config_objs.filter import Filter
 from src.models.config_objs.agg_function import AggFunction
 from src.read_config.get_config import get_config
+from src.read_config.filter_engine import filter_mask
+from src.utilities.profiling import stage
+
+
+def _filter_agg(df: pd.DataFrame, agg_data: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Filters df down to the rows the aggregation described by `agg_data` is over.
+    """
+    if len(agg_data["filters"]) == 0:
+        return df
+
+    return df.loc[
+        filter_mask(
+            df,
+            [Filter(**f) for f in agg_data["filters"]],
+            agg_data.get("disjunction", False),
+        )
+    ]
 
 
 def custom_aggregations(df: pd.DataFrame) -> Dict[str, Any]:
@@ -24,18 +40,80 @@ def custom_aggregations(df: pd.DataFrame) -> Dict[str, Any]:
     res = {}
     for agg in data:
         agg_data = data[agg]
-
-        if len(agg_data["filters"]) > 0:
-            conjunction = reduce(
-                __or__ if agg_data.get("disjunction", False) else __and__,
-                map(lambda f: Filter(**f).filter_cond(df), agg_data["filters"]),
+        with stage(agg, "custom"):
+            res[agg] = AggFunction(**agg_data["agg"]).aggregate(
+                _filter_agg(df, agg_data)
             )
 
-            filtered = df.loc[conjunction]
+    return res
 
-        else:
-            filtered = df
 
-        res[agg] = AggFunction(**agg_data["agg"]).aggregate(filtered)
+class ChunkedAggregations:
+    """
+    Performs all custom aggregations on a DataFrame that is read a chunk at a
+    time. Only aggregations whose functions are in `CHUNKABLE_FUNCS` are supported.
 
-    return res
+    Attributes:
+        states (Dict[str, Tuple[Any, int]]): the merged state of every chunk so
+            far, for each aggregation
+    """
+
+    states: Dict[str, Tuple[Any, int]]
+
+    def __init__(self) -> None:
+        self.states = {}
+
+    @staticmethod
+    def columns() -> Set[str]:
+        """
+        Returns every column used by the custom aggregations, so that only
+        those need to be read.
+
+        Parameters:
+            None
+
+        Returns:
+            columns (Set[str]): the names of the columns
+        """
+        cols = set()
+        for agg_data in get_config()["aggregations"].values():
+            cols |= {f["column"] for f in agg_data["filters"]}
+            if agg_data["agg"].get("column") is not None:
+                cols.add(agg_data["agg"]["column"])
+
+        return cols
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Adds the next chunk to the aggregations.
+
+        Parameters:
+            chunk (DataFrame): the next chunk of the DataFrame
+
+        Returns:
+            None
+        """
+        data = get_config()["aggregations"]
+        for agg in data:
+            func = AggFunction(**data[agg]["agg"])
+            state = func.partial(_filter_agg(chunk, data[agg]))
+            self.states[agg] = (
+                func.merge(self.states[agg], state) if agg in self.states else state
+            )
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Returns the value of each aggregation over every chunk so far.
+
+        Parameters:
+            None
+
+        Returns:
+            aggs (Dict[str, Any]): a mapping of agg name to value
+        """
+        data = get_config()["aggregations"]
+        return {
+            agg: AggFunction(**data[agg]["agg"]).finish(self.states[agg])
+            for agg in data
+            if agg in self.states
+        }
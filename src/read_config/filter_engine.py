@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Hashable, List, NamedTuple, Tuple
+
+from src.models.config_objs.filter import Filter
+from src.utilities.decorators import cache_by_frame
+
+
+class Predicate(NamedTuple):
+    """
+    A canonical, hashable version of a Filter.
+
+    Attributes:
+        column (str): which column of the DataFrame to compare
+        operator (str): how to compare the column to the value
+        value (Hashable): the value to compare to, with lists turned into tuples
+    """
+
+    column: str
+    operator: str
+    value: Hashable
+
+
+class CompiledFilter(NamedTuple):
+    """
+    A canonical set of filters that are either all combined with AND or all
+    combined with OR. Two lines or aggregations with the same filters, in any
+    order, compile to the same CompiledFilter.
+
+    Attributes:
+        predicates (Tuple[Predicate, ...]): the distinct filters, sorted
+        disjunction (bool): whether the predicates are combined with OR
+    """
+
+    predicates: Tuple[Predicate, ...]
+    disjunction: bool
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Recursively converts lists into tuples so the value can be hashed.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_freeze, value))
+
+    return value
+
+
+def compile_filters(filters: List[Filter], disjunction: bool = False) -> CompiledFilter:
+    """
+    Canonicalizes a list of filters.
+
+    Parameters:
+        filters (List[Filter]): the filters to combine
+        disjunction (bool): whether to combine the filters using OR instead of
+            AND. Default is False
+
+    Returns:
+        compiled (CompiledFilter): the canonical form of the filters
+    """
+    predicates = {Predicate(f.column, f.operator, _freeze(f.value)) for f in filters}
+    return CompiledFilter(
+        tuple(sorted(predicates, key=repr)),
+        disjunction and len(predicates) > 1,
+    )
+
+
+@cache_by_frame
+def _frame_masks(df: pd.DataFrame) -> Dict[Hashable, np.ndarray]:
+    """
+    Returns the masks already evaluated on df, by Predicate and CompiledFilter.
+    """
+    return {}
+
+
+def _predicate_mask(df: pd.DataFrame, predicate: Predicate) -> np.ndarray:
+    """
+    Evaluates a single predicate on df, treating missing values as False.
+    """
+    value: Any = predicate.value
+    if isinstance(value, tuple):
+        value = list(value)
+
+    cond = Filter(**(predicate._asdict() | {"value": value})).filter_cond(df)
+    return pd.Series(cond).to_numpy(dtype=bool, na_value=False)
+
+
+def filter_mask(
+    df: pd.DataFrame, filters: List[Filter], disjunction: bool = False
+) -> np.ndarray:
+    """
+    Returns which rows of df pass the filters. Each distinct filter is only
+    evaluated once per DataFrame, no matter how many lines or aggregations use it.
+
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to filter
+        filters (List[Filter]): the filters to apply. If empty, every row passes
+        disjunction (bool): whether to combine the filters using OR instead of
+            AND. Default is False
+
+    Returns:
+        mask (np.ndarray): an array of booleans that can filter df
+    """
+    compiled = compile_filters(filters, disjunction)
+    masks = _frame_masks(df)
+
+    if compiled not in masks:
+        for predicate in compiled.predicates:
+            if predicate not in masks:
+                masks[predicate] = _predicate_mask(df, predicate)
+
+        if len(compiled.predicates) == 0:
+            masks[compiled] = np.ones(df.shape[0], dtype=bool)
+        else:
+            combine = np.logical_or if compiled.disjunction else np.logical_and
+            masks[compiled] = combine.reduce([masks[p] for p in compiled.predicates])
+
+    return masks[compiled]
@@ -1,18 +1,17 @@
 import numpy as np
 import pandas as pd
 from typing import Tuple, List, cast
-from operator import __or__, __and__
-from functools import reduce
+from copy import deepcopy
+from functools import partial
 from os.path import join
 
 from src.models.config_objs.plot import Plot
 from src.read_config.get_config import get_config
+from src.read_config.filter_engine import filter_mask
 from src.models.types import Plotter
-from src.utilities.df_common import (
-    group_by_month,
-    group_by_week,
-    filter_large_transactions,
-)
+from src.utilities.df_common import large_transactions, period_codes
+from src.utilities.helpers import get_months, get_weeks
+from src.utilities.profiling import profiled
 from src.read_data.column import Column
 
 from src.visualizations.common import metrics_over_time
@@ -28,7 +27,8 @@ def _read_convert_plots() -> List[Plot]:
     Returns:
         plots (List[Plot]): a list of converted plots
     """
-    data = get_config()["plots"]
+    # converting the plots modifies the dictionaries they're read from
+    data = deepcopy(get_config()["plots"])
 
     for plot in data:
         new_lines = []
@@ -63,7 +63,9 @@ def plotters_from_config() -> Tuple[List[Plotter], List[Plotter]]:
     monthlys = []
     yearlys = []
     for plot in plots:
-        plotter = cast(Plotter, lambda df, out: create_plot(plot, df, out))
+        plotter = cast(
+            Plotter, profiled(partial(create_plot, plot), "config", plot.plot_name)
+        )
         if plot.timeframe == "monthly":
             monthlys.append(plotter)
         elif plot.timeframe == "yearly":
@@ -86,35 +88,37 @@ def create_plot(plot: Plot, df: pd.DataFrame, out_dir: str) -> None:
     Returns:
         None
     """
-    filt_total = 0.0
     if plot.timeframe == "monthly":
-        starts, partitions = group_by_week(df)
+        date_func = get_weeks
     elif plot.timeframe == "yearly":
-        starts, partitions = group_by_month(df)
+        date_func = get_months
     else:
         raise ValueError(f"Invalid timeframe: {plot.timeframe}")
 
+    starts = date_func(df[Column.DATE].min().date(), df[Column.DATE].max().date())
+    codes = period_codes(df[Column.DATE], starts)
+    prices = df[Column.PRICE].to_numpy()
+    large = large_transactions(df).to_numpy()
+    kept = ~large | (df[Column.CATEGORY] == "Bills").to_numpy()
+
+    def period_sums(mask: np.ndarray) -> np.ndarray:
+        return np.bincount(codes[mask], weights=prices[mask], minlength=len(starts))
+
+    filt_total = 0.0
     metrics = {}
     for line in plot.lines:
         if len(line.filters) == 0:
-            y_vals = list(map(lambda p: p[Column.PRICE].sum(), partitions))
+            y_vals = period_sums(np.ones(df.shape[0], dtype=bool))
 
         else:
-            y_vals = []
-            for part in partitions:
-                conjunction = reduce(
-                    __or__ if line.disjunction else __and__,
-                    map(lambda f: f.filter_cond(part), line.filters),
-                )
-
-                part_filt, to_add = filter_large_transactions(part.loc[conjunction])
-                y_vals.append(part_filt[Column.PRICE].sum())
-                filt_total += to_add
-
-        y_vals_arr = np.array(y_vals) + (filt_total / len(y_vals))
+            mask = filter_mask(df, line.filters, line.disjunction)
+            y_vals = period_sums(mask & kept)
+            filt_total += prices[mask & large].sum()
+
+        y_vals_arr = y_vals + (filt_total / len(y_vals))
         if line.agg is not None:
             y_vals_arr = np.full(
-                len(partitions), getattr(np, line.agg.func)(y_vals_arr)
+                len(starts), getattr(np, line.agg.func)(y_vals_arr)
             ).tolist()
 
         metrics[line.label] = (y_vals_arr, line.style)
@@ -0,0 +1,141 @@
+import json
+import hashlib
+import pandas as pd
+from os import replace, stat
+from os.path import basename, dirname, join
+from typing import Any, Dict, Optional
+
+from src.read_data.journal import journal_meta
+
+CACHE_VERSION = 4
+
+
+def cache_path(path: str) -> str:
+    """
+    Returns the path of the cached, typed copy of the spreadsheet at `path`. The
+    cache lives next to the spreadsheet as a hidden file.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        cache (str): the path of the cached DataFrame
+    """
+    return join(dirname(path), f".{basename(path)}.cache.feather")
+
+
+def _meta_path(path: str) -> str:
+    """
+    Returns the path of the file recording what the cache was built from.
+    """
+    return join(dirname(path), f".{basename(path)}.cache.json")
+
+
+def file_hash(path: str) -> str:
+    """
+    Hashes the contents of the file at `path`.
+
+    Parameters:
+        path (str): the path of the file
+
+    Returns:
+        digest (str): the hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def _source_meta(path: str, with_hash: bool) -> Dict[str, Any]:
+    """
+    Describes the current state of the spreadsheet at `path`, and its journal.
+    """
+    st = stat(path)
+    meta: Dict[str, Any] = {
+        "version": CACHE_VERSION,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "journal": journal_meta(path),
+    }
+    if with_hash:
+        meta["sha256"] = file_hash(path)
+
+    return meta
+
+
+def _write_meta(path: str, meta: Dict[str, Any]) -> None:
+    """
+    Atomically writes the cache metadata for the spreadsheet at `path`.
+    """
+    tmp = _meta_path(path) + ".tmp"
+    with open(tmp, "w") as out:
+        json.dump(meta, out)
+
+    replace(tmp, _meta_path(path))
+
+
+def load_cache(path: str) -> Optional[pd.DataFrame]:
+    """
+    Loads the cached DataFrame for the spreadsheet at `path`, as long as the
+    spreadsheet hasn't changed since the cache was written. The modification time
+    and size are checked first, and the contents are only hashed if the
+    modification time changed but the size didn't.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        df (Optional[DataFrame]): the cached DataFrame, or None if there is no
+            valid cache
+    """
+    try:
+        with open(_meta_path(path), "r") as f:
+            cached_meta = json.load(f)
+
+        current = _source_meta(path, with_hash=False)
+        if cached_meta.get("version") != current["version"]:
+            return None
+
+        if cached_meta.get("size") != current["size"]:
+            return None
+
+        if cached_meta.get("journal") != current["journal"]:
+            return None
+
+        if cached_meta.get("mtime_ns") != current["mtime_ns"]:
+            if cached_meta.get("sha256") != file_hash(path):
+                return None
+
+            # only the modification time changed, so the cache is still valid
+            _write_meta(path, current | {"sha256": cached_meta["sha256"]})
+
+        return pd.read_feather(cache_path(path))
+
+    except (OSError, ValueError):
+        return None
+
+
+def save_cache(path: str, df: pd.DataFrame) -> None:
+    """
+    Caches the typed DataFrame read from the spreadsheet at `path`. Failing to
+    write the cache is not an error, it just means the next read will be slow.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+        df (DataFrame): the typed DataFrame read from `path`
+
+    Returns:
+        None
+    """
+    try:
+        meta = _source_meta(path, with_hash=True)
+        tmp = cache_path(path) + ".tmp"
+        df.reset_index(drop=True).to_feather(tmp)
+        replace(tmp, cache_path(path))
+        _write_meta(path, meta)
+
+    except (OSError, ValueError, TypeError):
+        return
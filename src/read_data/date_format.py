@@ -0,0 +1,86 @@
+import pandas as pd
+from typing import Optional, Tuple
+
+
+# the formats tried on the Date column, in order. Days never come before months,
+# to agree with how ambiguous dates are parsed by the mixed parser. Dates like
+# 01/02/2024 and 01-02-2024 aren't listed, since the mixed parser has its own fast
+# path for them that beats parsing them with a format
+DATE_FORMATS = (
+    "ISO8601",
+    "%m/%d/%y",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%y %H:%M",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%d %b %Y",
+    "%d-%b-%Y",
+)
+
+# the key in `DataFrame.attrs` recording how the Date column was parsed
+DATE_PARSING_ATTR = "date_parsing"
+
+
+def detect_date_format(dates: pd.Series, sample_size: int = 1000) -> Optional[str]:
+    """
+    Finds a format in `DATE_FORMATS` that parses every date in an evenly spaced
+    sample of `dates`.
+
+    Parameters:
+        dates (Series): the unparsed dates, as strings
+        sample_size (int): how many dates to check each format against. Default
+            is 1000
+
+    Returns:
+        fmt (Optional[str]): the first format that matches the whole sample, or
+            None if none do
+    """
+    values = dates.dropna()
+    if values.shape[0] == 0:
+        return None
+
+    sample = values.iloc[:: max(1, values.shape[0] // sample_size)]
+    for fmt in DATE_FORMATS:
+        # checking the first date on its own rules out most formats cheaply
+        if all(
+            pd.to_datetime(dates_to_check, format=fmt, errors="coerce").notna().all()
+            for dates_to_check in (sample.iloc[:1], sample)
+        ):
+            return fmt
+
+    return None
+
+
+def parse_dates(dates: pd.Series) -> Tuple[pd.Series, str]:
+    """
+    Parses `dates` with a single strict format if `detect_date_format` finds one,
+    which is much faster than parsing each date on its own. Any dates that don't
+    match the format, and every date if there is no format, go through the slow
+    mixed parser instead, so the result is the same either way.
+
+    Parameters:
+        dates (Series): the unparsed dates, as strings
+
+    Returns:
+        parsed (Series): the parsed dates
+        path (str): a description of how the dates were parsed
+    """
+    fmt = detect_date_format(dates)
+    if fmt is None:
+        return _parse_mixed(dates), "mixed"
+
+    parsed = pd.to_datetime(dates, format=fmt, errors="coerce")
+    failed = parsed.isna() & dates.notna()
+    if not failed.any():
+        return parsed, fmt
+
+    parsed[failed] = _parse_mixed(dates[failed])
+    return parsed, f"{fmt}, with {failed.sum()} mixed"
+
+
+def _parse_mixed(dates: pd.Series) -> pd.Series:
+    """
+    Parses each of `dates` on its own, whatever its format.
+    """
+    return pd.to_datetime(dates, format="mixed", dayfirst=False, yearfirst=False)
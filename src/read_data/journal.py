@@ -0,0 +1,90 @@
+import pandas as pd
+from os import stat
+from os.path import basename, dirname, exists, getsize, join
+from typing import List, Optional
+
+from src.read_data.column import Column
+
+
+# once the journal is this many bytes, it's compacted into the spreadsheet
+JOURNAL_MAX_BYTES = 1 << 16
+
+
+def journal_path(path: str) -> str:
+    """
+    Returns the path of the journal of rows appended to the spreadsheet at
+    `path` that haven't been written to it yet. The journal lives next to the
+    spreadsheet as a hidden csv.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        journal (str): the path of the journal
+    """
+    return join(dirname(path), f".{basename(path)}.journal.csv")
+
+
+def journal_meta(path: str) -> Optional[List[int]]:
+    """
+    Describes the current state of the journal of the spreadsheet at `path`, so
+    that caches of the spreadsheet's data can tell when rows were appended.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        meta (Optional[List[int]]): the size and modification time of the
+            journal, or None if there is no journal
+    """
+    try:
+        st = stat(journal_path(path))
+
+    except FileNotFoundError:
+        return None
+
+    return [st.st_size, st.st_mtime_ns]
+
+
+def append_journal(df: pd.DataFrame, path: str) -> bool:
+    """
+    Appends rows to the journal of the spreadsheet at `path`, without touching
+    the spreadsheet itself, so it takes the same time however big the
+    spreadsheet is.
+
+    Parameters:
+        df (DataFrame): the rows to append, with the spreadsheet's columns
+        path (str): the path of the spreadsheet
+
+    Returns:
+        full (bool): whether the journal is now at least `JOURNAL_MAX_BYTES` and
+            should be compacted
+    """
+    journal = journal_path(path)
+    write_cols = [col for col in df.columns.tolist() if col != Column.TRANSACTION_ID]
+    df.to_csv(
+        journal,
+        index=False,
+        mode="a",
+        columns=write_cols,
+        header=not exists(journal),
+    )
+    return getsize(journal) >= JOURNAL_MAX_BYTES
+
+
+def read_journal(path: str) -> Optional[pd.DataFrame]:
+    """
+    Reads the rows appended to the spreadsheet at `path` that haven't been
+    written to it yet, without applying the schema.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        rows (Optional[DataFrame]): the rows in the journal, or None if there is
+            no journal
+    """
+    if not exists(journal_path(path)):
+        return None
+
+    return pd.read_csv(journal_path(path), header=0)
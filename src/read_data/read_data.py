@@ -1,14 +1,16 @@
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_string_dtype
+from pandas.api.types import is_string_dtype, union_categoricals
 from os.path import splitext
 
 from functools import lru_cache
-from uuid import uuid4
-from numbers_parser import Document
-from typing import List, cast, Dict
+from typing import Iterable, Iterator, List, cast
 
 from src.read_data.column import Column
+from src.read_data.data_cache import load_cache, save_cache
+from src.read_data.date_format import DATE_PARSING_ATTR, parse_dates
+from src.read_data.journal import read_journal
+from src.read_data.write_data import write_data
 
 
 SCHEMA = {
@@ -17,15 +19,31 @@ SCHEMA = {
     Column.PRICE: "float",
     Column.IS_FOOD: "int",
     Column.CONTROLLABLE: "int",
-    Column.TRANSACTION_ID: "str",
 }
 
+# string columns with few distinct values, stored as categoricals
+CATEGORICAL_COLUMNS = (Column.CATEGORY, "Description", "Vendor")
+
+# how each column is read when streaming a csv, before the schema is applied.
+# Price is left to be inferred, so that it's only cleaned if it has to be
+CSV_DTYPES = {
+    Column.DATE: "str",
+    Column.CATEGORY: "str",
+    Column.IS_FOOD: "int8",
+    Column.CONTROLLABLE: "int8",
+}
+
+# whether the typed data of spreadsheets is cached, which `--no-cache` turns off
+_use_cache_mut: List[bool] = [True]
+
 
 @lru_cache(maxsize=32)
 def read_data(path: str) -> pd.DataFrame:
     """
     Reads the data and converts any columns that need converting. Can read
-    many different file types.
+    many different file types. The converted data is cached next to the
+    spreadsheet and reused until the spreadsheet changes, unless `--no-cache`
+    was passed on the command line.
 
     Parameters:
         path (str): the path of the spreadsheet
@@ -33,52 +51,196 @@ def read_data(path: str) -> pd.DataFrame:
     Returns:
         df (DataFrame): a Pandas DataFrame with the spreadsheet info
     """
+    if _use_cache():
+        cached = load_cache(path)
+        if cached is not None:
+            cached.attrs[DATE_PARSING_ATTR] = "cached"
+            return cached
+
+    df = _parse_data(path)
+    if _use_cache():
+        save_cache(path, df)
+
+    return df
+
+
+def append_data(rows: pd.DataFrame, path: str) -> pd.DataFrame:
+    """
+    Appends rows to the spreadsheet at `path`, and returns its updated data. If
+    the spreadsheet's typed data is cached, only the appended rows are typed and
+    they're added to the cached data, which is cached again, instead of the
+    whole spreadsheet being read again. The result is the same either way.
+
+    Parameters:
+        rows (DataFrame): the rows to append, with the spreadsheet's columns
+        path (str): the path of the spreadsheet
+
+    Returns:
+        df (DataFrame): the typed data of the whole spreadsheet, as `read_data`
+            would return it
+    """
+    before = load_cache(path) if _use_cache() else None
+    write_data(rows.copy(), path, mode="a")
+    read_data.cache_clear()
+    if before is None:
+        return read_data(path)
+
+    delta = rows[before.columns.drop(Column.TRANSACTION_ID)].copy()
+    for col in delta.select_dtypes(object).columns:
+        # empty cells are read back as missing
+        delta[col] = delta[col].mask(delta[col] == "")
+
+    # the IDs hash each row's position in the spreadsheet, which carries on from
+    # the rows before
+    delta = _apply_schema(delta)
+    delta.index = pd.RangeIndex(before.shape[0], before.shape[0] + delta.shape[0])
+    delta[Column.TRANSACTION_ID] = transaction_ids(delta)
+
+    # categoricals are combined separately, since concatenating them with other
+    # categories would turn them back into strings
+    cat_cols = [col for col in CATEGORICAL_COLUMNS if col in before.columns]
+    df = pd.concat(
+        [before.drop(columns=cat_cols), delta.drop(columns=cat_cols)],
+        ignore_index=True,
+    )
+    for cat_col in cat_cols:
+        df[cat_col] = union_categoricals(
+            [before[cat_col], delta[cat_col]], sort_categories=True
+        )
+
+    df = df[before.columns]
+
+    save_cache(path, df)
+    return read_data(path)
+
+
+def disable_cache() -> None:
+    """
+    Stops caching the typed data of spreadsheets from now on in this process,
+    so they're always read from the spreadsheet itself.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    _use_cache_mut[0] = False
+
+
+def _use_cache() -> bool:
+    """
+    Returns whether the typed data of spreadsheets should be cached.
+    """
+    return _use_cache_mut[0]
+
+
+def _parse_data(path: str) -> pd.DataFrame:
+    """
+    Reads the spreadsheet at `path` and applies the schema.
+    """
     readers = {
         ".txt": _read_csv,
         ".csv": _read_csv,
         ".numbers": _read_numbers,
         ".xlsx": _read_excel,
     }
-    df = readers[splitext(path)[1]](path)
+    df = _apply_schema(readers[splitext(path)[1]](path))
+    df[Column.TRANSACTION_ID] = transaction_ids(df)
 
-    new_cols: Dict[str, np.ndarray] = {
-        Column.TRANSACTION_ID: np.fromiter(
-            map(lambda _: str(uuid4()), np.empty(df.shape[0])),
-            count=df.shape[0],
-            dtype=np.dtypes.StringDType(),
-        )
-    }
+    return df
+
+
+def read_csv_chunks(
+    path: str, chunk_size: int, columns: Iterable[str] = ()
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads the csv at `path` a chunk at a time, so that only `chunk_size` rows are
+    ever in memory at once. Only the columns in `SCHEMA` and `columns` are read,
+    and each chunk has the schema applied to it. Chunks don't have transaction IDs.
+
+    Parameters:
+        path (str): the path of the csv
+        chunk_size (int): how many rows to read at a time
+        columns (Iterable[str]): any columns to read on top of those in `SCHEMA`.
+            Columns that aren't in the csv are ignored
+
+    Returns:
+        chunks (Iterator[DataFrame]): the typed chunks, in order
+    """
+    if splitext(path)[1] not in (".txt", ".csv"):
+        raise ValueError(f"Only csv files can be read in chunks, not {path}.")
+
+    wanted = set(SCHEMA) | set(columns)
+    with pd.read_csv(
+        path,
+        header=0,
+        encoding="ISO-8859-1",
+        usecols=lambda col: col in wanted,
+        dtype=CSV_DTYPES,
+        chunksize=chunk_size,
+    ) as reader:
+        for chunk in reader:
+            yield _apply_schema(chunk)
+
+
+def _apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the columns of the unprocessed DataFrame df to their proper types.
+    """
     if is_string_dtype(df[Column.PRICE]):
-        new_cols[Column.PRICE] = np.array(
-            df[Column.PRICE].str.replace(
-                r"[^\d\-.]",
-                "",
-                regex=True,
-            )
+        df[Column.PRICE] = df[Column.PRICE].str.replace(
+            r"[^\d\-.]",
+            "",
+            regex=True,
         )
 
-    df = df.assign(**new_cols)
     for col_name, dtype in SCHEMA.items():
         df[col_name] = df[col_name].astype(cast(pd.BooleanDtype, dtype))
 
-    df[Column.IS_FOOD] = df[Column.IS_FOOD].astype("boolean")
-    df[Column.CONTROLLABLE] = df[Column.CONTROLLABLE].astype("boolean")
-    df[Column.DATE] = pd.to_datetime(
-        df[Column.DATE], format="mixed", dayfirst=False, yearfirst=False
-    )
+    for cat_col in CATEGORICAL_COLUMNS:
+        if cat_col in df.columns:
+            df[cat_col] = df[cat_col].astype("category")
+
+    df[Column.IS_FOOD] = df[Column.IS_FOOD].astype(bool)
+    df[Column.CONTROLLABLE] = df[Column.CONTROLLABLE].astype(bool)
+    df[Column.DATE], df.attrs[DATE_PARSING_ATTR] = parse_dates(df[Column.DATE])
 
     return df
 
 
+def transaction_ids(df: pd.DataFrame) -> np.ndarray:
+    """
+    Generates an ID for each transaction by hashing its row position together with
+    its contents, so reading the same spreadsheet always gives the same IDs.
+
+    Parameters:
+        df (DataFrame): the typed transactions, indexed by their row position in
+            the spreadsheet. Any existing Transaction ID column is ignored
+
+    Returns:
+        ids (np.ndarray): an unsigned 64 bit integer ID for each row
+    """
+    return pd.util.hash_pandas_object(
+        df.drop(columns=Column.TRANSACTION_ID, errors="ignore"), index=True
+    ).to_numpy()
+
+
 def _read_excel(path: str) -> pd.DataFrame:
     """
-    Reads an excel file and turns it into an unprocessed DataFrame.
+    Reads an excel file and turns it into an unprocessed DataFrame, along with
+    any rows in its journal that haven't been written to it yet.
     """
-    return pd.read_excel(
+    df = pd.read_excel(
         path,
         sheet_name="Sheet1",
         header=0,
     )
+    appended = read_journal(path)
+    if appended is None:
+        return df
+
+    return pd.concat([df, appended], ignore_index=True)
 
 
 def _read_csv(path: str) -> pd.DataFrame:
@@ -92,6 +254,8 @@ def _read_numbers(path: str) -> pd.DataFrame:
     """
     Reads a numbers file and turns it into an unprocessed DataFrame.
     """
+    from numbers_parser import Document
+
     data = Document(path).sheets[0].tables[0].rows(values_only=True)
     return pd.DataFrame(data[1:], columns=data[0])
 
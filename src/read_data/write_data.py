@@ -1,8 +1,12 @@
 import pandas as pd
+from os import remove
 from os.path import basename, splitext
 from typing import Literal
 
 from src.read_data.column import Column
+from src.read_data.data_cache import load_cache, save_cache
+from src.read_data.date_format import parse_dates
+from src.read_data.journal import append_journal, journal_path, read_journal
 
 
 def write_data(df: pd.DataFrame, path: str, mode: Literal["w", "a", "x"] = "w") -> None:
@@ -41,6 +45,7 @@ def _write_csv(df: pd.DataFrame, path: str, mode: Literal["w", "a", "x"] = "w")
         index=False,
         mode=mode,
         columns=write_cols,
+        header=mode != "a",
     )
 
 
@@ -57,13 +62,56 @@ def _write_excel(
     df: pd.DataFrame, path: str, mode: Literal["w", "a", "x"] = "w"
 ) -> None:
     """
-    Writes a DataFrame to a xlsx file.
+    Writes a DataFrame to a xlsx file. Appended rows go to the spreadsheet's
+    journal instead, since rewriting the workbook gets slower the bigger it is,
+    and they're written to the workbook all at once when the journal is full.
     """
     if mode == "x":
         raise NotImplementedError(
             "Writing to excel with mode 'x' is not currently supported."
         )
 
+    if mode == "a":
+        if append_journal(df, path):
+            compact_journal(path)
+
+        return
+
+    _write_workbook(df, path, mode)
+
+
+def compact_journal(path: str) -> None:
+    """
+    Writes the rows in the journal of the xlsx at `path` to it in one batch, and
+    removes the journal. If the spreadsheet's typed data was cached, the cache
+    is kept, since the data is the same.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        None
+    """
+    rows = read_journal(path)
+    if rows is None:
+        return
+
+    cached = load_cache(path)
+
+    # written as dates, like the rows entered before the journal was used
+    rows[Column.DATE] = parse_dates(rows[Column.DATE])[0].dt.date
+    _write_workbook(rows, path, "a")
+    remove(journal_path(path))
+
+    if cached is not None:
+        save_cache(path, cached)
+
+
+def _write_workbook(df: pd.DataFrame, path: str, mode: Literal["w", "a"]) -> None:
+    """
+    Writes a DataFrame to the first sheet of the workbook at `path`, after any
+    rows already in it if appending.
+    """
     with pd.ExcelWriter(
         path, engine="openpyxl", mode=mode, if_sheet_exists="overlay"
     ) as writer:
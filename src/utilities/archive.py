@@ -0,0 +1,180 @@
+from contextlib import contextmanager
+from os import remove, walk
+from os.path import exists, join, relpath, sep, splitext
+from queue import Queue
+from threading import Thread, local
+from types import TracebackType
+from typing import Iterator, List, Optional, Set, Tuple, Type
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+from src.models.paths import ALLOWED_EXTNS
+
+
+# files that are already compressed, which deflate would only slow down
+STORED_EXTNS = {".png", ".jpg", ".jpeg", ".gif", ".zip"}
+
+
+class ArchiveWriter:
+    """
+    Writes outputs to a zip archive as they're produced. Files are read when
+    they're added, and compressed and written on a background thread, so the
+    archive is written while the next outputs are being made. Images are
+    stored as they are, and everything else is deflated.
+
+    Attributes:
+        path (str): the path of the archive
+        root (str): the directory the paths in the archive are relative to
+    """
+
+    path: str
+    root: str
+
+    def __init__(self, path: str, root: str) -> None:
+        self.path = path
+        self.root = root
+        self._added: Set[str] = set()
+        self._entries: "Queue[Optional[Tuple[ZipInfo, bytes]]]" = Queue()
+        self._error: List[Optional[BaseException]] = [None]
+        self._thread = Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def _write(self) -> None:
+        """
+        Writes the queued entries to the archive until `close` is called.
+        """
+        try:
+            with ZipFile(self.path, "w") as archive:
+                entry = self._entries.get()
+                while entry is not None:
+                    archive.writestr(*entry)
+                    entry = self._entries.get()
+
+        except Exception as e:
+            self._error[0] = e
+            # keep draining, so adding files never blocks
+            while self._entries.get() is not None:
+                pass
+
+    def add(self, path: str, final_path: Optional[str] = None) -> None:
+        """
+        Adds a file to the archive, unless it's hidden, in a hidden directory or
+        already in the archive.
+
+        Parameters:
+            path (str): the path of the file to add
+            final_path (Optional[str]): where the file will end up, if it's
+                about to be moved, which decides its path in the archive.
+                Default is `path`
+
+        Returns:
+            None
+        """
+        name = relpath(final_path or path, self.root)
+        hidden = any(part.startswith(".") for part in name.split(sep))
+        if hidden or name in self._added:
+            return
+
+        self._added.add(name)
+        info = ZipInfo.from_file(path, name)
+        stored = splitext(name)[1].lower() in STORED_EXTNS
+        info.compress_type = ZIP_STORED if stored else ZIP_DEFLATED
+        with open(path, "rb") as f:
+            self._entries.put((info, f.read()))
+
+    def add_tree(self) -> None:
+        """
+        Adds every file under `root` that isn't in the archive yet, skipping
+        hidden directories and spreadsheets, so the outputs that were added as
+        they were made are only added once.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        for dir_path, dir_names, file_names in walk(self.root):
+            dir_names[:] = sorted(d for d in dir_names if not d.startswith("."))
+            for file in sorted(file_names):
+                if splitext(file)[1] not in ALLOWED_EXTNS:
+                    self.add(join(dir_path, file))
+
+    def close(self) -> None:
+        """
+        Finishes writing the archive, raising any error hit while writing it.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self._entries.put(None)
+        self._thread.join()
+        if self._error[0] is not None:
+            raise self._error[0]
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        failed = exc is not None
+        try:
+            self.close()
+
+        except Exception:
+            failed = True
+            raise
+
+        finally:
+            # a partly written archive isn't worth keeping
+            if failed and exists(self.path):
+                remove(self.path)
+
+
+# the archive each thread is adding its outputs to, so outputs made on other
+# threads aren't added to it
+_current = local()
+
+
+@contextmanager
+def archiving_to(archive: ArchiveWriter) -> Iterator[None]:
+    """
+    Adds the outputs reported with `archive_output` inside the context, on this
+    thread, to `archive`.
+
+    Parameters:
+        archive (ArchiveWriter): the archive to add the outputs to
+
+    Returns:
+        context (Iterator[None]): the context to run the analysis in
+    """
+    _current.archive = archive
+    try:
+        yield
+
+    finally:
+        _current.archive = None
+
+
+def archive_output(path: str, final_path: Optional[str] = None) -> None:
+    """
+    Adds an output to the archive being written, if there is one. Does nothing
+    otherwise.
+
+    Parameters:
+        path (str): the path of the output
+        final_path (Optional[str]): where the output will end up, if it's about
+            to be moved. Default is `path`
+
+    Returns:
+        None
+    """
+    archive: Optional[ArchiveWriter] = getattr(_current, "archive", None)
+    if archive is not None:
+        archive.add(path, final_path)
@@ -0,0 +1,155 @@
+import locale
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# guards the process-wide locale while the conventions are read from it
+_locale_lock = Lock()
+
+
+def _grouping_intervals(grouping: List[int]) -> Iterator[int]:
+    """
+    Generates the sizes of the digit groups, from the right, as `localeconv`
+    describes them.
+    """
+    last_interval = None
+    for interval in grouping:
+        if interval == locale.CHAR_MAX:
+            return
+
+        if interval == 0:
+            if last_interval is None:
+                raise ValueError("invalid grouping")
+
+            while True:
+                yield last_interval
+
+        yield interval
+        last_interval = interval
+
+
+def _user_conventions() -> Dict[str, Any]:
+    """
+    Reads the conventions of the user's locale.
+    """
+    with _locale_lock:
+        locale.setlocale(locale.LC_ALL, "")
+        return dict(locale.localeconv())
+
+
+class CurrencyFormatter:
+    """
+    Formats amounts of money like `locale.currency` with grouping, but reads the
+    locale's conventions only once, so formatting doesn't touch the
+    process-wide locale. It's never changed after it's made, so it can be used
+    from any thread.
+
+    Attributes:
+        conventions (Dict[str, Any]): the monetary conventions, as from
+            `locale.localeconv`
+    """
+
+    conventions: Dict[str, Any]
+
+    def __init__(self, conventions: Optional[Dict[str, Any]] = None) -> None:
+        self.conventions = _user_conventions() if conventions is None else conventions
+        self._digits = self.conventions["frac_digits"]
+        self._arrangements = (self._arrange(False), self._arrange(True))
+
+    def _arrange(self, negative: bool) -> Tuple[str, str]:
+        """
+        Returns what goes before and after the digits of a positive or negative
+        amount, following `locale.currency`.
+        """
+        conv = self.conventions
+        prefix = "n_" if negative else "p_"
+        s = "<\0>"
+
+        smb = conv["currency_symbol"]
+        separated = " " if conv[prefix + "sep_by_space"] else ""
+        if conv[prefix + "cs_precedes"]:
+            s = smb + separated + s
+        else:
+            s = s + separated + smb
+
+        sign_pos = conv[prefix + "sign_posn"]
+        sign = conv["negative_sign" if negative else "positive_sign"]
+        if sign_pos == 0:
+            s = "(" + s + ")"
+        elif sign_pos == 2:
+            s = s + sign
+        elif sign_pos == 3:
+            s = s.replace("<", sign)
+        elif sign_pos == 4:
+            s = s.replace(">", sign)
+        else:
+            s = sign + s
+
+        before, after = s.replace("<", "").replace(">", "").split("\0")
+        return before, after
+
+    def _digits_of(self, money: float) -> str:
+        """
+        Formats the absolute value of an amount, grouping the whole part of it.
+        """
+        conv = self.conventions
+        whole, _, frac = f"{abs(money):.{self._digits}f}".partition(".")
+
+        groups = []
+        for interval in _grouping_intervals(conv["mon_grouping"]):
+            if len(whole) <= interval:
+                break
+
+            groups.append(whole[-interval:])
+            whole = whole[:-interval]
+
+        groups.append(whole)
+        digits = conv["mon_thousands_sep"].join(reversed(groups))
+        return digits + conv["mon_decimal_point"] + frac if frac else digits
+
+    def format(self, money: float) -> str:
+        """
+        Formats an amount of money.
+
+        Parameters:
+            money (float): the amount of money
+
+        Returns:
+            formatted (str): the amount formatted into a currency string
+        """
+        if self._digits == locale.CHAR_MAX:
+            raise ValueError(
+                "Currency formatting is not possible using the 'C' locale."
+            )
+
+        before, after = self._arrangements[money < 0]
+        return before + self._digits_of(money) + after
+
+    def format_all(self, amounts: Iterable[float]) -> List[str]:
+        """
+        Formats many amounts of money at once, such as the values of an array or
+        a Series.
+
+        Parameters:
+            amounts (Iterable[float]): the amounts of money
+
+        Returns:
+            formatted (List[str]): each amount formatted into a currency string,
+                in the same order
+        """
+        return [self.format(money) for money in amounts]
+
+
+@lru_cache(maxsize=None)
+def currency_formatter() -> CurrencyFormatter:
+    """
+    Returns the formatter for the user's locale, which is made the first time
+    it's needed.
+
+    Parameters:
+        None
+
+    Returns:
+        formatter (CurrencyFormatter): the shared formatter
+    """
+    return CurrencyFormatter()
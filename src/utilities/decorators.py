@@ -1,8 +1,13 @@
-from typing import Callable, Dict, no_type_check
+import pandas as pd
+from typing import Any, Callable, Dict, TypeVar, no_type_check
 from dataclasses import dataclass
+from functools import wraps
+from weakref import finalize
 
 from src.utilities.dictionary_ops import convert_dict
 
+T = TypeVar("T")
+
 
 def dataclass_from_converted_json(
     converters: Dict[str, Callable]
@@ -51,3 +56,29 @@ def dataclass_from_json(cls: type) -> type:
         new_type (type): the type with the added functionality
     """
     return dataclass_from_converted_json({})(cls)
+
+
+def cache_by_frame(func: Callable[[pd.DataFrame], T]) -> Callable[[pd.DataFrame], T]:
+    """
+    Decorator that memoizes a function of a single DataFrame by the identity of
+    that DataFrame, for as long as the DataFrame is alive. DataFrames passed to
+    the function should not be modified in place afterwards.
+
+    Parameters:
+        func (Callable[[DataFrame], T]): the function to memoize
+
+    Returns:
+        cached (Callable[[DataFrame], T]): the memoized function
+    """
+    cache: Dict[int, Any] = {}
+
+    @wraps(func)
+    def inner(df: pd.DataFrame) -> T:
+        key = id(df)
+        if key not in cache:
+            cache[key] = func(df)
+            finalize(df, cache.pop, key, None)
+
+        return cache[key]
+
+    return inner
@@ -8,6 +8,48 @@ from src.read_data.column import Column
 from src.read_config.get_config import config_globals
 
 
+def period_codes(dates: pd.Series, starts: List[date]) -> np.ndarray:
+    """
+    Finds which period each date falls in, where each period starts on one of
+    `starts` and ends right before the next one starts. The last period has
+    no end.
+
+    Parameters:
+        dates (Series): a Pandas Series of datetimes
+        starts (List[date]): the sorted starting date of each period
+
+    Returns:
+        codes (np.ndarray): for each date, the index in `starts` of its period,
+            or -1 if it comes before the first period
+    """
+    values = dates.to_numpy()
+    bounds = np.array(starts, dtype="datetime64[D]").astype(values.dtype)
+    return np.searchsorted(bounds, values, side="right") - 1
+
+
+def partition_by_dates(df: pd.DataFrame, starts: List[date]) -> List[pd.DataFrame]:
+    """
+    Divides the df into one partition per date in `starts`, as defined in
+    `period_codes`. The df is sorted by date once, so each partition is just a
+    slice of the sorted df.
+
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to divide
+        starts (List[date]): the sorted starting date of each period. Rows before
+            the first period are left out
+
+    Returns:
+        partitions (List[DataFrame]): the list of partitions, one per start date
+    """
+    if not df[Column.DATE].is_monotonic_increasing:
+        df = df.sort_values(Column.DATE, kind="stable")
+
+    values = df[Column.DATE].to_numpy()
+    bounds = np.array(starts, dtype="datetime64[D]").astype(values.dtype)
+    offsets = np.append(np.searchsorted(values, bounds, side="left"), df.shape[0])
+    return [df.iloc[offsets[i] : offsets[i + 1]] for i in range(len(starts))]
+
+
 def _group_df(
     df: pd.DataFrame, date_func: Callable[[date, date], List[date]]
 ) -> Tuple[List[date], List[pd.DataFrame]]:
@@ -27,17 +69,7 @@ def _group_df(
         return [], []
 
     dates = date_func(df[Column.DATE].min().date(), df[Column.DATE].max().date())
-    partitions = []
-    for i in range(len(dates) - 1):
-        partitions.append(
-            df.loc[
-                (pd.to_datetime(df[Column.DATE]).dt.date >= dates[i])
-                & (pd.to_datetime(df[Column.DATE]).dt.date < dates[i + 1])
-            ]
-        )
-
-    partitions.append(df.loc[pd.to_datetime(df[Column.DATE]).dt.date >= dates[-1]])
-    return dates, partitions
+    return dates, partition_by_dates(df, dates)
 
 
 def group_by_week(df: pd.DataFrame) -> Tuple[List[date], List[pd.DataFrame]]:
@@ -68,6 +100,24 @@ def group_by_month(df: pd.DataFrame) -> Tuple[List[date], List[pd.DataFrame]]:
     return _group_df(df, get_months)
 
 
+def large_transactions(df: pd.DataFrame) -> pd.Series:
+    """
+    Finds the transactions at or above `PROJECTED_SPENDING_LARGE_EXPENSE_THRESHOLD`.
+    A threshold of zero means no transaction is large.
+
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to search
+
+    Returns:
+        large (Series): a series of booleans that can filter df down to its
+            large transactions
+    """
+    thresh = config_globals()["PROJECTED_SPENDING_LARGE_EXPENSE_THRESHOLD"]
+    if thresh == 0:
+        thresh = np.inf
+    return df[Column.PRICE] >= thresh
+
+
 def filter_large_transactions(df: pd.DataFrame) -> Tuple[pd.DataFrame, float]:
     """
     Throws out outlier transactions that throw off certain calculations.
@@ -79,10 +129,46 @@ def filter_large_transactions(df: pd.DataFrame) -> Tuple[pd.DataFrame, float]:
         df (DataFrame): the filtered DataFrame
         filtered_out (float): how much money was filtered out
     """
-    thresh = config_globals()["PROJECTED_SPENDING_LARGE_EXPENSE_THRESHOLD"]
-    if thresh == 0:
-        thresh = np.inf
+    large = large_transactions(df)
     return (
-        df.loc[(df[Column.PRICE] < thresh) | (df[Column.CATEGORY] == "Bills")],
-        cast(float, df.loc[df[Column.PRICE] >= thresh][Column.PRICE].sum()),
+        df.loc[~large | (df[Column.CATEGORY] == "Bills")],
+        cast(float, df.loc[large][Column.PRICE].sum()),
     )
+
+
+def projected_bills(df: pd.DataFrame) -> pd.Series:
+    """
+    Finds the bills that are smoothed out over their whole month when projecting
+    spending, i.e. the bills at or above `PROJECTED_SPENDING_BILL_THRESHOLD`. A
+    negative threshold disables the smoothing, and a threshold of zero smooths
+    every bill (though `weekly_projection` doesn't smooth any with it).
+
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to search
+
+    Returns:
+        bills (Series): a series of booleans that can filter df down to its bills
+    """
+    thresh = config_globals()["PROJECTED_SPENDING_BILL_THRESHOLD"]
+    return (df[Column.CATEGORY] == "Bills") & (
+        df[Column.PRICE] >= (thresh if thresh >= 0 else np.inf)
+    )
+
+
+def memory_report(df: pd.DataFrame) -> None:
+    """
+    Prints how much memory each column of `df` uses, counting the contents of
+    object and categorical columns.
+
+    Parameters:
+        df (DataFrame): the DataFrame to report on
+
+    Returns:
+        None
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    width = max(len(str(col)) for col in usage.index) if len(usage) else 0
+    for col, n_bytes in usage.items():
+        print(f"{str(col):<{width}}  {str(df[col].dtype):<14}{n_bytes:>12,} B")
+
+    print(f"{'Total':<{width}}  {'':<14}{usage.sum():>12,} B")
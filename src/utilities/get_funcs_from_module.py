@@ -1,15 +1,19 @@
 from os import getcwd, listdir
-from os.path import sep, splitext, abspath, join
+from os.path import basename, dirname, sep, splitext, abspath, join
 from importlib import import_module
-from inspect import getmembers, isfunction, getfile
+from inspect import getmembers, isfunction, getfile, unwrap
 
 from typing import List, Callable
 
+from src.utilities.profiling import profiled
+
 
 def get_funcs_from_module(path: str) -> List[Callable]:
     """
     Finds all public functions defined in the Python module
-    at `path`. Assumes `path` is somewhere in the cwd.
+    at `path`. Assumes `path` is somewhere in the cwd. If profiling is
+    enabled, each function is wrapped so its calls are recorded, with the
+    module's directory as their category.
 
     Parameters:
         path (str): the path to the module
@@ -22,9 +26,9 @@ def get_funcs_from_module(path: str) -> List[Callable]:
     mod_name = raw[int(raw.startswith(".")) : len(raw) - int(raw.endswith("."))]
 
     return [
-        func
+        profiled(func, basename(dirname(path_abs)))
         for (name, func) in getmembers(import_module(mod_name), isfunction)
-        if not name.startswith("_") and getfile(func) == path_abs
+        if not name.startswith("_") and getfile(unwrap(func)) == path_abs
     ]
 
 
@@ -1,4 +1,3 @@
-import locale
 import pandas as pd
 from typing import List, cast
 from datetime import timedelta, date
@@ -7,6 +6,7 @@ from src.models.day_counts import DayCounts
 from src.models.paths import Paths
 from src.read_data.column import Column
 from src.read_config.get_config import config_globals
+from src.utilities.currency import currency_formatter
 
 
 def monthly_income() -> float:
@@ -27,7 +27,8 @@ def monthly_income() -> float:
 
 def format_currency(money: float) -> str:
     """
-    Formats the currency nicely.
+    Formats the currency nicely, with the shared formatter from
+    `currency_formatter`.
 
     Parameters:
         money (float): the amount of money
@@ -36,8 +37,7 @@ def format_currency(money: float) -> str:
         formatted (str): the same number formatted into a
             currency string
     """
-    locale.setlocale(locale.LC_ALL, "")
-    return locale.currency(money, grouping=True)
+    return currency_formatter().format(money)
 
 
 def get_weeks(min_day: date, max_day: date) -> List[date]:
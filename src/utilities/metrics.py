@@ -0,0 +1,149 @@
+import pandas as pd
+from collections import Counter
+from functools import wraps
+from inspect import unwrap
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, TypeVar
+from weakref import finalize
+
+from src.models.paths import Paths
+from src.read_config.get_config import get_config
+
+T = TypeVar("T")
+
+Metric = Callable[[pd.DataFrame], Any]
+
+_hits: Counter = Counter()
+_misses: Counter = Counter()
+
+
+class MetricStats(NamedTuple):
+    hits: int
+    misses: int
+
+
+def metric(
+    *inputs: Metric,
+) -> Callable[[Callable[[pd.DataFrame], T]], Callable[[pd.DataFrame], T]]:
+    """
+    Returns a decorator that registers a function of a single DataFrame as a
+    metric. A metric declares the other metrics it uses, so that they can be
+    evaluated in order with `evaluation_order`, and its result is memoized by the
+    identity of the DataFrame together with the config and year, for as long as
+    the DataFrame is alive. DataFrames passed to a metric should not be modified
+    in place afterwards.
+
+    Parameters:
+        inputs (Metric): the metrics the decorated function calls
+
+    Returns:
+        deco (Callable): the decorator to use on the function
+    """
+
+    def inner(func: Callable[[pd.DataFrame], T]) -> Callable[[pd.DataFrame], T]:
+        cache: Dict[int, Dict[Tuple[int, int], Any]] = {}
+
+        @wraps(func)
+        def memoized(df: pd.DataFrame) -> T:
+            frame_cache = cache.get(id(df))
+            if frame_cache is None:
+                frame_cache = cache[id(df)] = {}
+                finalize(df, cache.pop, id(df), None)
+
+            key = (id(get_config()), Paths.get_year())
+            if key in frame_cache:
+                _hits[func.__name__] += 1
+
+            else:
+                _misses[func.__name__] += 1
+                frame_cache[key] = func(df)
+
+            return frame_cache[key]
+
+        memoized.__metric_inputs__ = inputs  # type: ignore
+        return memoized
+
+    return inner
+
+
+def metric_inputs(func: Callable) -> Tuple[Metric, ...]:
+    """
+    Returns the metrics that `func` declared it uses.
+
+    Parameters:
+        func (Callable): the function to check
+
+    Returns:
+        inputs (Tuple[Metric, ...]): the metrics it uses, which is empty if `func`
+            isn't a metric
+    """
+    return getattr(func, "__metric_inputs__", ())
+
+
+def evaluation_order(funcs: List[Callable]) -> List[Callable]:
+    """
+    Orders `funcs`, and every metric they use, so that each comes after all of
+    the metrics it uses. Otherwise, the order of `funcs` is kept. A metric that
+    one of `funcs` wraps, e.g. to profile it, is replaced by that function
+    wherever it's used, so it's only evaluated once.
+
+    Parameters:
+        funcs (List[Callable]): the functions to order
+
+    Returns:
+        order (List[Callable]): the functions and their inputs, in the order to
+            evaluate them
+    """
+    order: List[Callable] = []
+    visiting: List[Callable] = []
+    wrappers = {unwrap(func): func for func in funcs}
+
+    def visit(func: Callable) -> None:
+        if func in order:
+            return
+
+        if func in visiting:
+            raise ValueError(f"Metric {func.__name__} depends on itself.")
+
+        visiting.append(func)
+        for dep in metric_inputs(func):
+            visit(wrappers.get(unwrap(dep), dep))
+
+        visiting.remove(func)
+        order.append(func)
+
+    for func in funcs:
+        visit(func)
+
+    return order
+
+
+def metric_stats() -> Dict[str, MetricStats]:
+    """
+    Returns how many times each metric was served from its cache (hits) and how
+    many times it had to be computed (misses) since the last
+    `reset_metric_stats`.
+
+    Parameters:
+        None
+
+    Returns:
+        stats (Dict[str, MetricStats]): the hits and misses of each metric, by name
+    """
+    return {
+        name: MetricStats(_hits[name], _misses[name])
+        for name in sorted(set(_hits) | set(_misses))
+    }
+
+
+def reset_metric_stats() -> None:
+    """
+    Resets the counts returned by `metric_stats`.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    _hits.clear()
+    _misses.clear()
@@ -68,4 +68,75 @@ def parse_args() -> argparse.Namespace:
         ),
     )
 
+    cli_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "re-read the spreadsheet instead of using the cached copy next to it. "
+            + "Default False"
+        ),
+    )
+
+    cli_parser.add_argument(
+        "--compact-journal",
+        action="store_true",
+        help=(
+            "first write any transactions added from the UI to the xlsx, instead "
+            + "of waiting for enough of them to be added. Default False"
+        ),
+    )
+
+    cli_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="how many processes to render the plots with. Default 1",
+    )
+
+    cli_parser.add_argument(
+        "--force-render",
+        action="store_true",
+        help=(
+            "render every plot, even those whose data and config haven't changed "
+            + "since they were last rendered. Default False"
+        ),
+    )
+
+    cli_parser.add_argument(
+        "--reuse-figures",
+        action="store_true",
+        help=(
+            "build each monthly chart's figure once and only update its data for "
+            + "each month, which renders them faster. Default False"
+        ),
+    )
+
+    cli_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help=(
+            "read the csv this many rows at a time, keeping memory use bounded for "
+            + "large files. Only the validations and aggregations are run, not the "
+            + "plots. Default is to read the whole file at once"
+        ),
+    )
+
+    cli_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "record the time and memory taken by each stage and write them to "
+            + "profile.json next to the aggregations. Default False"
+        ),
+    )
+
+    cli_parser.add_argument(
+        "--trace-file",
+        help=(
+            "with --profile, also write the stages to this path as a Chrome trace. "
+            + "Default is not to write one"
+        ),
+    )
+
     return parser.parse_args()
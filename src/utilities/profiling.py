@@ -0,0 +1,270 @@
+import json
+import tracemalloc
+from contextlib import contextmanager
+from functools import update_wrapper
+from os import getpid
+from time import perf_counter, process_time, time
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class Span(NamedTuple):
+    """
+    How long one stage took and how much memory it used.
+
+    Attributes:
+        name (str): the name of the stage
+        category (str): what kind of stage it is, e.g. "monthly" for a monthly
+            plotter
+        start (float): when the stage started, in seconds since the epoch
+        wall (float): how long the stage took, in seconds
+        cpu (float): how much CPU time the stage's process spent on it, in seconds
+        peak_memory (int): the most memory the stage allocated at once, in bytes
+        pid (int): the ID of the process the stage ran in
+    """
+
+    name: str
+    category: str
+    start: float
+    wall: float
+    cpu: float
+    peak_memory: int
+    pid: int
+
+
+_enabled: List[bool] = [False]
+_spans: List[Span] = []
+
+# the peak memory of the finished children of each open stage, innermost last
+_child_peaks: List[int] = []
+
+
+def enable_profiling() -> None:
+    """
+    Starts recording a `Span` for every stage run from now on in this process,
+    discarding any recorded so far, e.g. those a forked worker process inherited.
+    Memory is traced while profiling, which makes everything slower.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    _enabled[0] = True
+    _spans.clear()
+    _child_peaks.clear()
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable_profiling() -> None:
+    """
+    Stops recording stages and tracing memory. Spans recorded so far are kept.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    _enabled[0] = False
+    tracemalloc.stop()
+
+
+def profiling_enabled() -> bool:
+    """
+    Returns whether stages are being recorded.
+
+    Parameters:
+        None
+
+    Returns:
+        enabled (bool): whether `enable_profiling` has been called
+    """
+    return _enabled[0]
+
+
+@contextmanager
+def stage(name: str, category: str) -> Iterator[None]:
+    """
+    Records a `Span` for the code run inside the context, if profiling is
+    enabled. Stages can be nested.
+
+    Parameters:
+        name (str): the name of the stage
+        category (str): what kind of stage it is
+
+    Returns:
+        context (Iterator[None]): the context to run the stage in
+    """
+    if not profiling_enabled():
+        yield
+        return
+
+    base, peak = tracemalloc.get_traced_memory()
+    if _child_peaks:
+        _child_peaks[-1] = max(_child_peaks[-1], peak)
+
+    tracemalloc.reset_peak()
+    _child_peaks.append(0)
+    start, wall, cpu = time(), perf_counter(), process_time()
+    try:
+        yield
+
+    finally:
+        wall, cpu = perf_counter() - wall, process_time() - cpu
+        peak = max(tracemalloc.get_traced_memory()[1], _child_peaks.pop())
+        tracemalloc.reset_peak()
+        if _child_peaks:
+            _child_peaks[-1] = max(_child_peaks[-1], peak)
+
+        _spans.append(Span(name, category, start, wall, cpu, peak - base, getpid()))
+
+
+class Profiled:
+    """
+    Wraps a function so that each call to it is recorded as a stage. Unlike a
+    closure, it can be pickled to send to worker processes. Other attributes are
+    looked up on the wrapped function.
+
+    Attributes:
+        func (Callable): the wrapped function
+        category (str): the category of its stages
+    """
+
+    func: Callable
+    category: str
+
+    def __init__(
+        self, func: Callable, category: str, name: Optional[str] = None
+    ) -> None:
+        self.func = func
+        self.category = category
+        update_wrapper(self, func)
+        if name is not None:
+            self.__name__ = name
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        with stage(self.__name__, self.category):
+            return self.func(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr == "func":
+            raise AttributeError(attr)
+
+        return getattr(self.func, attr)
+
+
+def profiled(func: Callable, category: str, name: Optional[str] = None) -> Callable:
+    """
+    Wraps func with `Profiled` if profiling is enabled, and otherwise returns it
+    as is.
+
+    Parameters:
+        func (Callable): the function to wrap
+        category (str): the category of its stages
+        name (Optional[str]): the name of its stages. Default is None, which uses
+            the name of func
+
+    Returns:
+        wrapped (Callable): the function to call instead of func
+    """
+    return Profiled(func, category, name) if profiling_enabled() else func
+
+
+def take_spans() -> List[Span]:
+    """
+    Removes and returns every span recorded in this process so far, so that
+    worker processes can send them back to the main process.
+
+    Parameters:
+        None
+
+    Returns:
+        spans (List[Span]): the recorded spans, in the order they finished
+    """
+    taken = list(_spans)
+    _spans.clear()
+    return taken
+
+
+def add_spans(spans: List[Span]) -> None:
+    """
+    Adds spans recorded in another process to this one's.
+
+    Parameters:
+        spans (List[Span]): the spans to add
+
+    Returns:
+        None
+    """
+    _spans.extend(spans)
+
+
+def _summarize(spans: List[Span]) -> List[Dict[str, Any]]:
+    """
+    Totals up the spans of each stage, slowest first.
+    """
+    totals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for span in spans:
+        total = totals.setdefault(
+            (span.category, span.name),
+            {
+                "name": span.name,
+                "category": span.category,
+                "calls": 0,
+                "wall": 0.0,
+                "cpu": 0.0,
+                "peak_memory": 0,
+            },
+        )
+        total["calls"] += 1
+        total["wall"] += span.wall
+        total["cpu"] += span.cpu
+        total["peak_memory"] = max(total["peak_memory"], span.peak_memory)
+
+    return sorted(totals.values(), key=lambda total: -total["wall"])
+
+
+def write_profile(path: str, trace_path: Optional[str] = None) -> None:
+    """
+    Writes every span recorded so far to `path` as JSON, along with the totals
+    for each stage. Times are in seconds and memory is in bytes.
+
+    Parameters:
+        path (str): where to write the JSON
+        trace_path (Optional[str]): where to also write the spans as a Chrome
+            trace, which can be opened in chrome://tracing or Perfetto. Default is
+            None, which doesn't write one
+
+    Returns:
+        None
+    """
+    with open(path, "w") as out:
+        json.dump(
+            {
+                "stages": _summarize(_spans),
+                "spans": [span._asdict() for span in _spans],
+            },
+            out,
+            indent=2,
+        )
+
+    if trace_path is None:
+        return
+
+    events = [
+        {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": span.start * 1e6,
+            "dur": span.wall * 1e6,
+            "pid": span.pid,
+            "tid": span.pid,
+            "args": {"cpu": span.cpu, "peak_memory": span.peak_memory},
+        }
+        for span in _spans
+    ]
+    with open(trace_path, "w") as out:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, out)
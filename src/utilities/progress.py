@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+from queue import Queue
+from threading import Event, local
+from typing import Iterator, Optional
+
+
+class Cancelled(Exception):
+    """
+    Raised by `report_progress` once the analysis it's reporting on is cancelled.
+    """
+
+
+class Progress:
+    """
+    The progress of an analysis running on another thread, which can be
+    followed and cancelled from the thread that started it.
+
+    Attributes:
+        events (Queue[str]): a message for each step of the analysis reached so
+            far, oldest first
+        cancelled (Event): set to stop the analysis at its next step
+    """
+
+    events: "Queue[str]"
+    cancelled: Event
+
+    def __init__(self) -> None:
+        self.events = Queue()
+        self.cancelled = Event()
+
+
+# the progress each thread is reporting to, so analyses on other threads don't
+# report to it
+_current = local()
+
+
+@contextmanager
+def reporting_to(progress: Progress) -> Iterator[None]:
+    """
+    Sends the steps reported with `report_progress` inside the context, on this
+    thread, to `progress`.
+
+    Parameters:
+        progress (Progress): where to report the steps
+
+    Returns:
+        context (Iterator[None]): the context to run the analysis in
+    """
+    _current.progress = progress
+    try:
+        yield
+
+    finally:
+        _current.progress = None
+
+
+def report_progress(message: str) -> None:
+    """
+    Reports that the analysis reached a new step, if something is following its
+    progress, raising `Cancelled` instead if the analysis was cancelled. Does
+    nothing otherwise.
+
+    Parameters:
+        message (str): a description of the step
+
+    Returns:
+        None
+    """
+    progress: Optional[Progress] = getattr(_current, "progress", None)
+    if progress is None:
+        return
+
+    if progress.cancelled.is_set():
+        raise Cancelled("Cancelled.")
+
+    progress.events.put(message)
@@ -1,7 +1,39 @@
 import numpy as np
-from typing import Dict, Tuple
-import matplotlib.pyplot as plt
+from typing import Dict, List, Tuple
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import matplotlib.dates as mdates
+from os.path import basename
+
+from src.visualizations.figure_reuse import reusable
+
+
+def _build_figure(
+    weeks: np.ndarray, metrics: Dict[str, Tuple[np.ndarray, str]], title: str
+) -> Tuple[Figure, Axes, List[Line2D]]:
+    """
+    Builds the figure for `metrics_over_time`, with a line for each metric.
+    """
+    fig = Figure()
+    ax = fig.subplots()
+    ax.set_title(title)
+    ax.set_ylabel("Dollars Spent Per Month")
+    ax.set_xlabel("Week start")
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%m/%d/%Y"))
+
+    lines = []
+    for metric_name, (values, style) in metrics.items():
+        args = (weeks, values, style)
+        if metric_name == "":
+            lines.extend(ax.plot(*args))
+        else:
+            lines.extend(ax.plot(*args, label=metric_name))
+
+    if len(metrics) > 1:
+        ax.legend()
+
+    return fig, ax, lines
 
 
 def metrics_over_time(
@@ -23,25 +55,16 @@ def metrics_over_time(
     Returns:
         None
     """
-    plt.clf()
-    plt.title(title)
-    plt.ylabel("Dollars Spent Per Month")
-    plt.xlabel("Week start")
+    fig, ax, lines = reusable(
+        basename(out), lambda: _build_figure(weeks, metrics, title)
+    )
+    for line, (values, _) in zip(lines, metrics.values()):
+        line.set_data(weeks, values)
 
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter("%m/%d/%Y"))
     kwargs = {"interval": 7} if len(weeks) <= 5 else {"bymonthday": 1}
-    plt.gca().xaxis.set_major_locator(mdates.DayLocator(**kwargs))
-
-    for metric_name, (values, style) in metrics.items():
-        args = (weeks, values, style)
-        if metric_name == "":
-            plt.plot(*args)
-        else:
-            plt.plot(*args, label=metric_name)
-
-    plt.gcf().autofmt_xdate()
-    if len(metrics) > 1:
-        plt.legend()
+    ax.xaxis.set_major_locator(mdates.DayLocator(**kwargs))
+    ax.relim()
+    ax.autoscale_view()
+    fig.autofmt_xdate()
 
-    plt.savefig(out)
-    plt.close()
+    fig.savefig(out)
@@ -0,0 +1,75 @@
+from typing import Any, Callable, Dict, List, TypeVar
+
+T = TypeVar("T")
+
+_enabled: List[bool] = [False]
+
+# the figure and artists of each chart, by the name of the file it's saved as
+_charts: Dict[str, Any] = {}
+
+
+def enable_figure_reuse() -> None:
+    """
+    Makes charts built with `reusable` keep their figure from one call to the
+    next, so that plotting them for another month only has to update the data,
+    labels and limits.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    _enabled[0] = True
+
+
+def disable_figure_reuse() -> None:
+    """
+    Makes charts build a new figure every time again, discarding the ones kept
+    so far.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    _enabled[0] = False
+    _charts.clear()
+
+
+def figure_reuse_enabled() -> bool:
+    """
+    Returns whether charts are keeping their figures.
+
+    Parameters:
+        None
+
+    Returns:
+        enabled (bool): whether `enable_figure_reuse` has been called
+    """
+    return _enabled[0]
+
+
+def reusable(name: str, build: Callable[[], T]) -> T:
+    """
+    Returns the figure and artists of a chart, built with `build`. When figure
+    reuse is enabled, they're only built the first time and the same ones are
+    returned after that, so the caller should replace everything it drew from
+    the data last time.
+
+    Parameters:
+        name (str): the name of the file the chart is saved as
+        build (Callable[[], T]): builds a new figure for the chart, along with
+            any of its artists the caller will need to update
+
+    Returns:
+        chart (T): what `build` returned for the chart
+    """
+    if not figure_reuse_enabled():
+        return build()
+
+    if name not in _charts:
+        _charts[name] = build()
+
+    return _charts[name]
@@ -1,9 +1,25 @@
-import matplotlib.pyplot as plt
 import pandas as pd
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.container import Container
+from matplotlib.figure import Figure
 from os.path import join
+from typing import List, Tuple, Union
 
 from src.calculations.controllable_proportions import controllable_proportions
-from src.utilities.helpers import format_currency
+from src.utilities.currency import currency_formatter
+from src.visualizations.figure_reuse import reusable
+
+
+def _build_figure() -> Tuple[Figure, Axes, List[Union[Artist, Container]]]:
+    """
+    Builds the figure for `controllable_bars`, without any bars.
+    """
+    fig = Figure()
+    ax = fig.subplots()
+    ax.set_title("How much spending is controllable")
+    ax.set_ylabel("Total spending")
+    return fig, ax, []
 
 
 def controllable_bars(df: pd.DataFrame, out_dir: str) -> None:
@@ -17,14 +33,18 @@ def controllable_bars(df: pd.DataFrame, out_dir: str) -> None:
     Returns:
         None
     """
-    plt.clf()
+    fig, ax, drawn = reusable("controllable.png", _build_figure)
+    # the bars drawn last time are replaced, so their color is given explicitly
+    # to stop it moving on to the next one in the cycle
+    for artist in drawn:
+        artist.remove()
 
-    plt.title("How much spending is controllable")
-    plt.ylabel("Total spending")
     props = controllable_proportions(df)
-    bar = plt.bar(["Controllable", "Not Controllable", "Total Income"], props)
-
-    plt.bar_label(bar, list(map(format_currency, props)))
-
-    plt.savefig(join(out_dir, "controllable.png"))
-    plt.close()
+    bar = ax.bar(
+        ["Controllable", "Not Controllable", "Total Income"], props, color="C0"
+    )
+    drawn[:] = [bar, *ax.bar_label(bar, currency_formatter().format_all(props))]
+    ax.relim()
+    ax.autoscale_view()
+
+    fig.savefig(join(out_dir, "controllable.png"))
@@ -1,10 +1,28 @@
 import numpy as np
 import pandas as pd
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.container import Container
+from matplotlib.figure import Figure
 from os.path import join
-import matplotlib.pyplot as plt
+from typing import List, Tuple, Union
 
-from src.utilities.helpers import format_currency
+from src.utilities.currency import currency_formatter
 from src.calculations.category_spending import category_spending
+from src.visualizations.figure_reuse import reusable
+
+
+def _build_figure() -> Tuple[Figure, Axes, List[Union[Artist, Container]]]:
+    """
+    Builds the figure for `spent_by_category`, without any bars.
+    """
+    fig = Figure()
+    fig.set_figheight(7)
+    ax = fig.subplots()
+    ax.set_title("Spending by category")
+    ax.set_ylabel("Total spent")
+    fig.subplots_adjust(bottom=0.2)
+    return fig, ax, []
 
 
 def spent_by_category(df: pd.DataFrame, out_dir: str) -> None:
@@ -23,17 +41,20 @@ def spent_by_category(df: pd.DataFrame, out_dir: str) -> None:
     sorted_keys = sorted(cats.keys(), key=cats.__getitem__, reverse=True)
     sorted_vals = list(map(cats.__getitem__, sorted_keys))
 
-    plt.clf()
-    plt.figure().set_figwidth(10)
-    plt.figure().set_figheight(7)
-    plt.title("Spending by category")
-    plt.ylabel("Total spent")
-    plt.gcf().subplots_adjust(bottom=0.2)
+    fig, ax, drawn = reusable("by_category.png", _build_figure)
+    # the bars drawn last time are replaced, so their color is given explicitly
+    # to stop it moving on to the next one in the cycle
+    for artist in drawn:
+        artist.remove()
 
     inds = np.arange(len(sorted_keys))
-    bar = plt.bar(inds, sorted_vals, 0.8)
-    plt.xticks(inds, sorted_keys, rotation=50)
-    plt.bar_label(bar, list(map(format_currency, sorted_vals)), rotation=70)
-
-    plt.savefig(join(out_dir, "by_category.png"))
-    plt.close()
+    bar = ax.bar(inds, sorted_vals, 0.8, color="C0")
+    ax.set_xticks(inds, sorted_keys, rotation=50)
+    labels = ax.bar_label(
+        bar, currency_formatter().format_all(sorted_vals), rotation=70
+    )
+    drawn[:] = [bar, *labels]
+    ax.relim()
+    ax.autoscale_view()
+
+    fig.savefig(join(out_dir, "by_category.png"))
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import matplotlib
+import pandas as pd
+from functools import partial
+from inspect import getsourcefile, unwrap
+from os import replace
+from os.path import join
+from typing import Any, Dict
+
+from src.read_config.get_config import get_config
+from src.read_data.data_cache import file_hash
+from src.models.paths import Paths
+from src.models.types import Plotter
+from src.read_data.column import Column
+
+
+MANIFEST_VERSION = 1
+
+# the name of the manifest in the plots directory
+MANIFEST_NAME = ".manifest.json"
+
+
+def frame_hash(df: pd.DataFrame) -> str:
+    """
+    Hashes the contents of a DataFrame, including its column names and types
+    but not its index or transaction IDs. The IDs depend on each row's position
+    in the spreadsheet, so leaving them out keeps a month's hash the same when
+    rows are added to or removed from an earlier month.
+
+    Parameters:
+        df (DataFrame): the DataFrame to hash
+
+    Returns:
+        digest (str): the hex digest of the DataFrame
+    """
+    df = df.drop(columns=Column.TRANSACTION_ID, errors="ignore")
+    digest = hashlib.sha256()
+    digest.update(repr(list(zip(map(str, df.columns), map(str, df.dtypes)))).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def plotter_name(plotter: Plotter) -> str:
+    """
+    Returns the name of a plotter, which for a plotter from the config is the
+    name of its plot.
+
+    Parameters:
+        plotter (Plotter): the plotter to name
+
+    Returns:
+        name (str): the name of the plotter
+    """
+    func = unwrap(plotter)
+    if isinstance(func, partial):
+        return func.args[0].plot_name
+
+    return func.__name__
+
+
+def plotter_hash(plotter: Plotter) -> str:
+    """
+    Hashes everything other than its data that a plotter's plots depend on: the
+    source of the module it's defined in, the config, the year being analyzed
+    and the version of matplotlib. Changes to code the plotter calls in other
+    modules aren't noticed.
+
+    Parameters:
+        plotter (Plotter): the plotter to hash
+
+    Returns:
+        digest (str): the hex digest of the plotter
+    """
+    func = unwrap(plotter)
+    if isinstance(func, partial):
+        func = func.func
+
+    digest = hashlib.sha256()
+    for part in (
+        plotter_name(plotter),
+        file_hash(str(getsourcefile(func))),
+        json.dumps(get_config(), sort_keys=True, default=str),
+        str(Paths.get_year()),
+        matplotlib.__version__,
+    ):
+        digest.update(part.encode())
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def load_manifest(plots_dir: str) -> Dict[str, Any]:
+    """
+    Loads the manifest of the plots rendered in `plots_dir`. It maps each
+    output directory, relative to `plots_dir`, and plotter name, joined by a
+    slash, to the hash of what the plotter's images there were rendered from
+    and the names of the images.
+
+    Parameters:
+        plots_dir (str): the directory the plots are in
+
+    Returns:
+        manifest (Dict[str, Any]): the manifest, which is empty if there isn't
+            one or it's from another version
+    """
+    try:
+        with open(join(plots_dir, MANIFEST_NAME), "r") as f:
+            manifest = json.load(f)
+
+    except (OSError, ValueError):
+        return {}
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+
+    return manifest["plots"]
+
+
+def save_manifest(plots_dir: str, manifest: Dict[str, Any]) -> None:
+    """
+    Atomically writes the manifest of the plots rendered in `plots_dir`.
+
+    Parameters:
+        plots_dir (str): the directory the plots are in
+        manifest (Dict[str, Any]): the manifest, as from `load_manifest`
+
+    Returns:
+        None
+    """
+    path = join(plots_dir, MANIFEST_NAME)
+    with open(path + ".tmp", "w") as out:
+        json.dump({"version": MANIFEST_VERSION, "plots": manifest}, out, indent=2)
+
+    replace(path + ".tmp", path)
@@ -3,12 +3,10 @@ from os.path import join
 from sankeyflow import Sankey
 import matplotlib.pyplot as plt
 
-from typing import List, NamedTuple, cast
-from itertools import chain
+from typing import Any, Dict, List, NamedTuple, cast
 
-from src.calculations.aggregations.estimated_income_after_tax import (
-    estimated_income_after_tax,
-)
+from src.calculations.aggregations.total_saved import total_saved
+from src.calculations.aggregations.total_spent import total_spent
 from src.models.paths import Paths
 from src.read_data.column import Column
 from src.utilities.dictionary_ops import (
@@ -36,27 +34,42 @@ class Flow(NamedTuple):
     options: dict = {}
 
 
-def _get_flows(source: str, d: NestedDict) -> List[Flow]:
+def _subtotals(d: NestedDict, totals: Dict[int, Number]) -> Number:
     """
-    Returns all the flows in this subdictionary.
+    Sums each dictionary in the tree once, from the leaves up, recording its
+    total in `totals` by its id.
     """
     if not isinstance(d, dict):
-        return []
+        return dictionary_sum(d)
+
+    total = sum(_subtotals(branch, totals) for branch in d.values())
+    totals[id(d)] = total
+    return total
+
+
+def _get_flows(
+    source: str, d: NestedDict, totals: Dict[int, Number], flows: List[Flow]
+) -> None:
+    """
+    Adds all the flows in this subdictionary to `flows`, using the subtotals
+    from `_subtotals`.
+    """
+    if not isinstance(d, dict):
+        return
 
     options = {}
     if source == "Income":
         options["flow_color_mode"] = "source"
 
-    this_layer = []
     for label, branch in d.items():
-        subtotal = dictionary_sum(branch)
+        subtotal = (
+            totals[id(branch)] if isinstance(branch, dict) else dictionary_sum(branch)
+        )
         if subtotal > 0:
-            this_layer.append(Flow(source, label, subtotal, options))
+            flows.append(Flow(source, label, subtotal, options))
 
-    this_layer.extend(
-        chain(*[_get_flows(label, branch) for label, branch in d.items()])
-    )
-    return this_layer
+    for label, branch in d.items():
+        _get_flows(label, branch, totals, flows)
 
 
 def sankey_flow(df: pd.DataFrame, out_dir: str) -> None:
@@ -70,29 +83,35 @@ def sankey_flow(df: pd.DataFrame, out_dir: str) -> None:
     Returns:
         None
     """
-    total_spent = df[Column.PRICE].sum()
+    spent = total_spent(df)
+    threshold = config_globals()["SANKEY_OTHER_THRESHOLD"]
 
-    flow = {
-        "Saved": estimated_income_after_tax(df) - total_spent,
+    flow: Dict[str, Any] = {
+        "Saved": total_saved(df),
         "Controllable": {"Other": 0},
         "Not Controllable": {"Food": {}, "Other": 0},
     }
 
-    cats = df.groupby([Column.CATEGORY])[Column.CONTROLLABLE].mean()
+    # every total is taken from one pass over the rows, grouped by category and,
+    # for the bills, description, and then summed up to the categories
+    desc_col = "Description"
+    has_desc = desc_col in df.columns
+    keys = [Column.CATEGORY, desc_col] if has_desc else [Column.CATEGORY]
+    groups = df.groupby(keys, observed=True, dropna=False).agg(
+        spent=(Column.PRICE, "sum"),
+        food=(Column.IS_FOOD, "sum"),
+        controllable=(Column.CONTROLLABLE, "sum"),
+        count=(Column.PRICE, "size"),
+    )
+    cats = groups.groupby(level=0, observed=True).sum()
 
-    for cat, controllable_prop in cats.items():
-        this_cat = df.loc[df[Column.CATEGORY] == cat]
-        cat_spent = this_cat[Column.PRICE].sum()
-        cat_t = (
-            cast(str, cat).title()
-            if cat_spent > total_spent * config_globals()["SANKEY_OTHER_THRESHOLD"]
-            else "Other"
-        )
+    for cat, cat_spent, food, controllable, count in cats.itertuples():
+        cat_t = cast(str, cat).title() if cat_spent > spent * threshold else "Other"
         control_key = (
-            "Controllable" if round(controllable_prop) == 1 else "Not Controllable"
+            "Controllable" if round(controllable / count) == 1 else "Not Controllable"
         )
 
-        if round(this_cat[Column.IS_FOOD].mean()) == 1:
+        if round(food / count) == 1:
             flow["Not Controllable"]["Food"][cat_t] = (
                 flow["Not Controllable"]["Food"].get(cat_t, 0) + cat_spent
             )
@@ -100,32 +119,30 @@ def sankey_flow(df: pd.DataFrame, out_dir: str) -> None:
         else:
             flow[control_key][cat_t] = flow[control_key].get(cat_t, 0) + cat_spent
 
-    desc_col = "Description"
-    if desc_col in df.columns:
-        bills_flow = {
-            bill_name: sub_df[Column.PRICE].sum()
-            for bill_name, sub_df in df.loc[df[Column.CATEGORY] == "Bills"].groupby(
-                desc_col
-            )
-        }
+    if has_desc and "Bills" in cats.index:
+        bills = groups["spent"].loc["Bills"]
+        bills_flow = bills[bills.index.notna()].to_dict()
         bills_total = sum(bills_flow.values())
 
         items = list(bills_flow.items())  # eagerly load indices before iteration
         for desc, total in items:
-            if total <= bills_total * config_globals()["SANKEY_OTHER_THRESHOLD"]:
+            if total <= bills_total * threshold:
                 del bills_flow[desc]
                 bills_flow["Other bills"] = bills_flow.get("Other bills", 0) + total
 
         if len(bills_flow) > 1:
             flow["Not Controllable"]["Bills"] = bills_flow
 
+    totals: Dict[int, Number] = {}
+    _subtotals(flow, totals)
+    flows: List[Flow] = []
+    _get_flows("Income", flow, totals, flows)
+
     plt.clf()
     plt.figure(figsize=(12, 8))
     plt.title(f"Spending Flow for {Paths.get_year()}")
 
-    s = Sankey(
-        flows=_get_flows("Income", flow),
-    )
+    s = Sankey(flows=flows)
     for node_list in s.nodes:
         for node in node_list:
             node.label_opts = {"fontsize": 8}
@@ -3,11 +3,45 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from os.path import join
-from typing import cast, List
+from datetime import date
+from typing import cast, List, Tuple
 
 from src.models.day_counts import DayCounts
 from src.utilities.helpers import monthly_income, get_weeks
 from src.read_data.column import Column
+from src.read_config.get_config import config_globals
+
+
+def _balance(
+    df: pd.DataFrame, payments: List[date], made: float, max_points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the times of each paycheck and day of spending in order, and the
+    balance after each. If there are more than `max_points` of them, and it's
+    positive, the range is split into at most that many bins of whole days, as
+    wide as the range needs, and only the balance at the end of each is kept.
+    """
+    spending = df.groupby(Column.DATE)[Column.PRICE].sum()
+    dates = np.concatenate(
+        [np.array(payments, dtype="datetime64[ns]"), spending.index.to_numpy()]
+    )
+    balance_changes = np.concatenate(
+        [np.full(len(payments), made), -spending.to_numpy(dtype=float)]
+    )
+
+    # stable, so that on the same day income comes in before spending goes out
+    inds = np.argsort(dates, kind="stable")
+    x = dates[inds]
+    y = np.cumsum(balance_changes[inds])
+
+    if 0 < max_points < len(x):
+        days = x.astype("datetime64[D]").astype(np.int64)
+        span = days[-1] - days[0] + 1
+        bins = (days - days[0]) // max(1, -(-span // max_points))
+        last_of_bin = np.append(bins[1:] != bins[:-1], True)
+        x, y = x[last_of_bin], y[last_of_bin]
+
+    return x, y
 
 
 def saved_over_time(df: pd.DataFrame, out_dir: str) -> None:
@@ -24,36 +58,11 @@ def saved_over_time(df: pd.DataFrame, out_dir: str) -> None:
     """
     fmt = "%b"
     payments = get_weeks(df[Column.DATE].min(), df[Column.DATE].max())
-    dates = []
-    balance_changes = []
-    expected_saved = [0.0]
-    for dtm in payments:
-        dates.append(dtm)
-        made = monthly_income() / DayCounts.weeks_per_month()
-        balance_changes.append(made)
-        expected_saved.append(expected_saved[-1] + (made * 0.2))
-
-    expected_saved = expected_saved[1:]
-
-    spending = df.groupby(Column.DATE)[Column.PRICE].sum()
-    for date, spent in spending.to_dict().items():
-        dates.append(date)
-        balance_changes.append(-spent)
-
-    inds = sorted(range(len(dates)), key=dates.__getitem__)
-    x = np.array(dates)[inds]
-    sorted_changes = np.array(balance_changes)[inds]
-    balance = [0.0]
-    for change in sorted_changes:
-        balance.append(balance[-1] + change)
+    made = monthly_income() / DayCounts.weeks_per_month()
+    expected_saved = np.cumsum(np.full(len(payments), made * 0.2))
+    x, y = _balance(df, payments, made, config_globals()["SAVED_OVER_TIME_MAX_POINTS"])
 
-    y = np.array(balance)[1:]
-
-    days_of_year = np.fromiter(
-        map(lambda d: int(d.strftime("%j")), x),
-        dtype=int,
-        count=x.shape[0],
-    )
+    days_of_year = pd.DatetimeIndex(x).dayofyear.to_numpy()
     poly_model = np.polynomial.Polynomial.fit(days_of_year, y, 3)
     trend = poly_model(days_of_year)
 
@@ -6,7 +6,8 @@ from datetime import datetime
 
 from src.models.paths import Paths
 from src.calculations.monthly_spending import monthly_spending
-from src.utilities.helpers import monthly_income, format_currency
+from src.utilities.currency import currency_formatter
+from src.utilities.helpers import monthly_income
 
 
 def saved_per_month(df: pd.DataFrame, out_dir: str) -> None:
@@ -45,8 +46,8 @@ def saved_per_month(df: pd.DataFrame, out_dir: str) -> None:
     plt.plot(inds, np.full(inds.shape[0], monthly_income() * 0.2), "y", label="Goal")
     plt.legend(loc="upper right")
 
-    for x_loc, y_loc in zip(inds, y):
-        ax.annotate(format_currency(y_loc), (x_loc, y_loc))
+    for x_loc, y_loc, label in zip(inds, y, currency_formatter().format_all(y)):
+        ax.annotate(label, (x_loc, y_loc))
 
     plt.savefig(join(out_dir, "saved_per_month.png"))
     plt.close()
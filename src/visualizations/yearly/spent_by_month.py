@@ -6,7 +6,8 @@ from os.path import join
 
 from src.models.day_counts import DayCounts
 from src.calculations.monthly_spending import monthly_spending
-from src.utilities.helpers import monthly_income, format_currency
+from src.utilities.currency import currency_formatter
+from src.utilities.helpers import monthly_income
 from src.read_data.column import Column
 
 
@@ -47,8 +48,8 @@ def spent_by_month(df: pd.DataFrame, out_dir: str) -> None:
     plt.plot(inds, np.full(inds.shape[0], monthly_income() * 0.8), "y", label="Goal")
     plt.legend(loc="upper right")
 
-    for x_loc, y_loc in zip(inds, y):
-        ax.annotate(format_currency(y_loc), (x_loc, y_loc))
+    for x_loc, y_loc, label in zip(inds, y, currency_formatter().format_all(y)):
+        ax.annotate(label, (x_loc, y_loc))
 
     plt.savefig(join(out_dir, "spent_per_month.png"))
     plt.close()
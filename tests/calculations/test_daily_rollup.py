@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from src.calculations.daily_rollup import combine_rollups, daily_rollup, RollupColumn
+from src.read_data.column import Column
+
+from tests.test_utils import sample_data
+
+
+def test_daily_rollup():
+    data = sample_data()
+    rollup = daily_rollup(data)
+
+    assert daily_rollup(data) is rollup
+    assert daily_rollup(rollup) is rollup
+
+    assert rollup[RollupColumn.COUNT].sum() == data.shape[0]
+    assert np.isclose(rollup[Column.PRICE].sum(), data[Column.PRICE].sum())
+    assert np.isclose(rollup[RollupColumn.BILL_PRICE].sum(), 1200)
+    assert rollup[RollupColumn.BILL_COUNT].sum() == 1
+
+
+def test_daily_rollup_config(overwrite_config):
+    data = sample_data()
+    rollup = daily_rollup(data)
+
+    overwrite_config({"globals": {"PROJECTED_SPENDING_BILL_THRESHOLD": 2000}})
+    assert daily_rollup(data) is not rollup
+    assert daily_rollup(data)[RollupColumn.BILL_COUNT].sum() == 0
+
+
+def test_combine_rollups():
+    data = sample_data()
+    halves = [data.iloc[: data.shape[0] // 2], data.iloc[data.shape[0] // 2 :]]
+    combined = combine_rollups(daily_rollup(half.copy()) for half in halves)
+
+    pd.testing.assert_frame_equal(combined, daily_rollup(data), check_dtype=False)
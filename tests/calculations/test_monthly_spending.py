@@ -1,10 +1,71 @@
 import numpy as np
+import pandas as pd
+import pytest
+from datetime import date, timedelta
 
 from src.calculations.monthly_spending import monthly_spending
+from src.models.day_counts import DayCounts
+from src.read_data.column import Column
+from src.utilities.helpers import time_filter
 
 from tests.test_utils import sample_data
 
 
+def _looped_monthly_spending(df, thresh):
+    """
+    The month by month implementation monthly_spending replaced.
+    """
+    current = df[Column.DATE].min().date()
+    end = df[Column.DATE].max().date()
+    res = {}
+    fmt = "%m/%d/%Y"
+
+    while current <= end:
+        next_date = date(
+            current.year + int(current.month == DayCounts.months_per_year()),
+            (current.month % DayCounts.months_per_year()) + 1,
+            1,
+        ) - timedelta(days=1)
+
+        month_df = time_filter(df, current.strftime(fmt), next_date.strftime(fmt))
+        filt_cond = (df[Column.CATEGORY] == "Bills") & (
+            df[Column.PRICE] >= (thresh if thresh >= 0 else np.inf)
+        )
+
+        bills = month_df.loc[filt_cond][Column.PRICE].sum()
+        month_df = month_df.loc[~filt_cond]
+
+        num_days = (month_df[Column.DATE].max() - month_df[Column.DATE].min()).days
+        spent = (month_df[Column.PRICE].sum() / num_days) * DayCounts.days_per_month()
+        spent += (bills / (next_date - current).days) * DayCounts.days_per_month()
+
+        res[current.strftime("%b")] = spent
+        current = next_date + timedelta(days=1)
+
+    return res
+
+
+def _multi_year_data():
+    rng = np.random.default_rng(0)
+    rows = 5000
+    categories = rng.choice(["Groceries", "Eating Out", "Bills", "Car"], rows)
+    prices = rng.gamma(2, 20, rows).round(2)
+    prices[categories == "Bills"] = rng.choice(
+        [60.0, 150.0, 1200.0], (categories == "Bills").sum()
+    )
+
+    return pd.DataFrame(
+        {
+            Column.DATE: pd.Timestamp("2023-03-14")
+            + pd.to_timedelta(rng.integers(0, 800, rows), unit="D"),
+            Column.CATEGORY: categories,
+            Column.PRICE: prices,
+            Column.IS_FOOD: pd.array(categories == "Groceries", dtype="boolean"),
+            Column.CONTROLLABLE: pd.array(rng.random(rows) < 0.5, dtype="boolean"),
+        }
+    )
+
+
 def test_monthly_spending():
     data = sample_data()
 
@@ -12,3 +73,15 @@ def test_monthly_spending():
     print(months)
     assert np.isclose(months["Jan"], 1620, atol=10)
     assert np.isclose(months["Feb"], 80, atol=5)
+
+
+@pytest.mark.parametrize("thresh", [100, 0, -1])
+def test_monthly_spending_matches_loop(overwrite_config, thresh):
+    overwrite_config({"globals": {"PROJECTED_SPENDING_BILL_THRESHOLD": thresh}})
+    data = _multi_year_data()
+
+    expected = _looped_monthly_spending(data, thresh)
+    months = monthly_spending(data)
+
+    assert list(months) == list(expected)
+    assert np.allclose(list(months.values()), list(expected.values()))
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from datetime import timedelta
+
+from src.calculations.weekly_projection import weekly_projection
+from src.models.day_counts import DayCounts
+from src.read_data.column import Column
+from src.utilities.helpers import get_weeks
+
+from tests.test_utils import sample_data
+
+
+@pytest.mark.parametrize("thresh", [100, 0, -1])
+def test_weekly_projection(overwrite_config, thresh):
+    overwrite_config({"globals": {"PROJECTED_SPENDING_BILL_THRESHOLD": thresh}})
+    data = sample_data()
+    bills = (data[Column.CATEGORY] == "Bills") & (
+        data[Column.PRICE] >= (thresh if thresh > 0 else np.inf)
+    )
+    weeks = get_weeks(data[Column.DATE].min().date(), data[Column.DATE].max().date())
+
+    projection = weekly_projection(data)
+    assert len(projection) == len(weeks)
+
+    for start, projected in zip(weeks, projection):
+        dates = data[Column.DATE].dt.date
+        week = data.loc[(dates >= start) & (dates < start + timedelta(weeks=1))]
+        month = data.loc[
+            (data[Column.DATE].dt.month == start.month)
+            & (data[Column.DATE].dt.year == start.year)
+        ]
+
+        not_bills = week.loc[~bills][Column.PRICE]
+        if not_bills.shape[0] == 0:
+            assert projected == 0.0
+            continue
+
+        days_in_month = month[Column.DATE].dt.days_in_month.iloc[0]
+        expected = (not_bills.sum() / 7) * DayCounts.days_per_month() + month.loc[
+            bills
+        ][Column.PRICE].sum() * (DayCounts.days_per_month() / days_in_month)
+        assert np.isclose(projected, expected)
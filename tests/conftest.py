@@ -0,0 +1,39 @@
+import pytest
+import yaml
+from typing import Iterator, List
+
+from src.models.paths import Paths
+from src.read_config.get_config import get_config
+
+
+@pytest.fixture(autouse=True)
+def sample_year():
+    """
+    Analyzes the year of the sample data, which is in the base config, instead
+    of the current year, which may only be in a local config overwrite.
+    """
+    year = Paths._year_mut[0]
+    Paths._year_mut[0] = 2024
+    yield
+    Paths._year_mut[0] = year
+
+
+@pytest.fixture
+def overwrite_config(tmp_path, monkeypatch) -> Iterator:
+    """
+    Returns a function that overwrites the configs for the rest of the test, as
+    a config_overwrite.yml would.
+    """
+    # the replaced configs are kept alive, so a new config can't reuse the id
+    # that results were cached under
+    replaced: List[dict] = []
+
+    def overwrite(config: dict) -> None:
+        path = tmp_path / "config_overwrite.yml"
+        path.write_text(yaml.safe_dump(config))
+        monkeypatch.setattr(Paths, "config_path", staticmethod(lambda: str(path)))
+        replaced.append(get_config())
+        get_config.cache_clear()
+
+    yield overwrite
+    get_config.cache_clear()
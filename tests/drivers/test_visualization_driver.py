@@ -0,0 +1,119 @@
+import pandas as pd
+from os import listdir
+
+from src.drivers.visualization_driver import render_changed, render_plots
+from src.read_config.plotters_from_config import plotters_from_config
+from src.read_data.column import Column
+from src.read_data.read_data import get_month_dfs, transaction_ids
+from src.visualizations.figure_reuse import disable_figure_reuse, enable_figure_reuse
+from src.visualizations.monthly.spent_by_week import spent_by_week
+
+from tests.test_utils import sample_data
+
+
+def test_render_plots(tmp_path):
+    _, yearlys = plotters_from_config()
+    data = sample_data()
+
+    for jobs in (1, 2):
+        out_dir = tmp_path / str(jobs)
+        out_dir.mkdir()
+        render_plots([(y, data, str(out_dir)) for y in yearlys], jobs)
+
+    serial = sorted(listdir(tmp_path / "1"))
+    assert len(serial) == len(yearlys)
+    assert serial == sorted(listdir(tmp_path / "2"))
+
+    for name in serial:
+        assert (tmp_path / "1" / name).read_bytes() == (
+            tmp_path / "2" / name
+        ).read_bytes()
+
+
+def test_render_plots_many_frames(tmp_path):
+    data = sample_data()
+    dfs = get_month_dfs(data) + [data]
+
+    for jobs in (1, 2):
+        for i in range(len(dfs)):
+            (tmp_path / str(jobs) / str(i)).mkdir(parents=True)
+
+        render_plots(
+            [
+                (spent_by_week, df, str(tmp_path / str(jobs) / str(i)))
+                for i, df in enumerate(dfs)
+            ],
+            jobs,
+        )
+
+    for i in range(len(dfs)):
+        assert (tmp_path / "1" / str(i) / "by_week.png").read_bytes() == (
+            tmp_path / "2" / str(i) / "by_week.png"
+        ).read_bytes()
+
+
+def test_figure_reuse(tmp_path):
+    data = sample_data()
+    dfs = get_month_dfs(data) + [data]
+
+    for mode in ("new", "reused"):
+        if mode == "reused":
+            enable_figure_reuse()
+
+        try:
+            for i, df in enumerate(dfs):
+                out_dir = tmp_path / mode / str(i)
+                out_dir.mkdir(parents=True)
+                render_plots([(spent_by_week, df, str(out_dir))])
+
+        finally:
+            disable_figure_reuse()
+
+    for i in range(len(dfs)):
+        assert (tmp_path / "new" / str(i) / "by_week.png").read_bytes() == (
+            tmp_path / "reused" / str(i) / "by_week.png"
+        ).read_bytes()
+
+
+def test_render_changed(tmp_path):
+    _, yearlys = plotters_from_config()
+    data = sample_data()
+    out_dir = tmp_path / "Combined"
+    out_dir.mkdir()
+    items = [(y, data, str(out_dir)) for y in yearlys]
+
+    assert render_changed(items, str(tmp_path)) == len(yearlys)
+    images = sorted(listdir(out_dir))
+    assert len(images) == len(yearlys)
+    assert render_changed(items, str(tmp_path)) == 0
+    assert render_changed(items, str(tmp_path), force=True) == len(yearlys)
+
+    (out_dir / images[0]).unlink()
+    assert render_changed(items, str(tmp_path)) == 1
+
+    changed = [(y, data.iloc[1:], str(out_dir)) for y in yearlys]
+    assert render_changed(changed, str(tmp_path)) == len(yearlys)
+    assert sorted(listdir(out_dir)) == images
+
+
+def test_render_changed_inserted_row(tmp_path):
+    def month_items(data):
+        items = []
+        for i, df in enumerate(get_month_dfs(data)):
+            out_dir = tmp_path / str(i)
+            out_dir.mkdir(exist_ok=True)
+            items.append((spent_by_week, df, str(out_dir)))
+
+        return items
+
+    data = sample_data()
+    assert render_changed(month_items(data), str(tmp_path)) == 2
+
+    # a new January row shifts the position, and so the ID, of every later row
+    inserted = pd.concat([data.iloc[:1], data]).reset_index(drop=True)
+    inserted[Column.TRANSACTION_ID] = transaction_ids(inserted)
+    items = month_items(inserted)
+    assert (
+        not items[1][1][Column.TRANSACTION_ID].isin(data[Column.TRANSACTION_ID]).any()
+    )
+    assert render_changed(items, str(tmp_path)) == 1
@@ -0,0 +1,49 @@
+from os import utime
+from os.path import join
+from time import time_ns
+
+from src.models.paths import _default_year, _first_spreadsheet, Paths
+
+from tests.test_utils import sample_data
+
+
+def test_lazy_year():
+    year = Paths._year_mut[0]
+    try:
+        Paths._year_mut[0] = None
+        assert Paths.get_year() == _default_year()
+        assert Paths._year_mut[0] == _default_year()
+
+        # the year isn't taken from data when no spreadsheet was passed
+        Paths._year_mut[0] = None
+        Paths.infer_year(sample_data())
+        assert Paths._year_mut[0] is None
+
+    finally:
+        Paths._year_mut[0] = year
+
+
+def test_first_spreadsheet(tmp_path):
+    parent = str(tmp_path)
+    assert _first_spreadsheet(parent, "Spending") == join(parent, "Spending.xlsx")
+
+    (tmp_path / "Spending.csv").touch()
+    assert _first_spreadsheet(parent, "Spending") == join(parent, "Spending.csv")
+
+    (tmp_path / "Spending.csv").unlink()
+    (tmp_path / "Spending.numbers").touch()
+    assert _first_spreadsheet(parent, "Spending") == join(parent, "Spending.numbers")
+
+
+def test_first_spreadsheet_coarse_mtime(tmp_path):
+    parent = str(tmp_path)
+
+    # a filesystem whose clock ticks too slowly to change the directory's
+    # modification time when a file is added just after it was listed
+    tick = time_ns()
+    utime(parent, ns=(tick, tick))
+    assert _first_spreadsheet(parent, "Spending") == join(parent, "Spending.xlsx")
+
+    (tmp_path / "Spending.csv").touch()
+    utime(parent, ns=(tick, tick))
+    assert _first_spreadsheet(parent, "Spending") == join(parent, "Spending.csv")
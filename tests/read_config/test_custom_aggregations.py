@@ -0,0 +1,30 @@
+import numpy as np
+
+from src.models.config_objs.agg_function import AggFunction, CHUNKABLE_FUNCS
+from src.read_config.custom_aggregations import (
+    ChunkedAggregations,
+    custom_aggregations,
+)
+from src.read_data.column import Column
+
+from tests.test_utils import sample_data
+
+
+def test_chunked_aggregations():
+    data = sample_data()
+    chunked = ChunkedAggregations()
+    for start in range(0, data.shape[0], 5):
+        chunked.update(data.iloc[start : start + 5])
+
+    assert chunked.result() == custom_aggregations(data)
+
+
+def test_agg_function_chunks():
+    data = sample_data()
+    for func_name in CHUNKABLE_FUNCS:
+        func = AggFunction(func=func_name, column=Column.PRICE)
+        state = func.partial(data.iloc[:0])
+        for start in range(0, data.shape[0], 4):
+            state = func.merge(state, func.partial(data.iloc[start : start + 4]))
+
+        assert np.isclose(func.finish(state), func.aggregate(data))
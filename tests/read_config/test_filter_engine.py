@@ -0,0 +1,34 @@
+import numpy as np
+
+from src.models.config_objs.filter import Filter
+from src.read_config.filter_engine import compile_filters, filter_mask
+from src.read_data.column import Column
+
+from tests.test_utils import sample_data
+
+
+def test_compile_filters():
+    food = Filter(Column.IS_FOOD, "=", 1)
+    bills = Filter(Column.CATEGORY, "in", ["Bills", "Rent"])
+
+    assert compile_filters([food, bills]) == compile_filters([bills, food, food])
+    assert compile_filters([food], True) == compile_filters([food], False)
+    assert compile_filters([food, bills], True) != compile_filters([food, bills])
+
+
+def test_filter_mask():
+    data = sample_data()
+    food = Filter(Column.IS_FOOD, "=", 1)
+    cheap = Filter(Column.PRICE, "<", 30)
+
+    conjunction = filter_mask(data, [food, cheap])
+    disjunction = filter_mask(data, [cheap, food], disjunction=True)
+
+    assert np.array_equal(
+        conjunction, (data[Column.IS_FOOD] & (data[Column.PRICE] < 30)).to_numpy()
+    )
+    assert np.array_equal(
+        disjunction, (data[Column.IS_FOOD] | (data[Column.PRICE] < 30)).to_numpy()
+    )
+    assert filter_mask(data, [cheap, food]) is conjunction
+    assert filter_mask(data, []).all()
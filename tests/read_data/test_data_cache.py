@@ -0,0 +1,27 @@
+import shutil
+from os import utime, stat
+from os.path import join
+
+from src.read_data.data_cache import load_cache, save_cache
+
+from tests.test_utils import sample_data
+
+
+def test_data_cache(tmp_path):
+    path = str(tmp_path / "Spending.xlsx")
+    shutil.copy(join("tests", "sample_data.xlsx"), path)
+    data = sample_data()
+
+    assert load_cache(path) is None
+
+    save_cache(path, data)
+    assert load_cache(path).equals(data)
+
+    st = stat(path)
+    utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert load_cache(path).equals(data)
+
+    with open(path, "ab") as f:
+        f.write(b"\0")
+
+    assert load_cache(path) is None
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from src.read_data.date_format import (
+    DATE_PARSING_ATTR,
+    detect_date_format,
+    parse_dates,
+)
+
+from tests.test_utils import sample_data
+
+
+def test_detect_date_format():
+    assert detect_date_format(pd.Series(["2024-01-02", "2024-12-31"])) == "ISO8601"
+    assert detect_date_format(pd.Series(["1/2/24", "12/31/24"])) == "%m/%d/%y"
+    assert detect_date_format(pd.Series(["Jan 2, 2024"])) == "%b %d, %Y"
+    assert detect_date_format(pd.Series(["1/2/24", "Jan 2, 2024"])) is None
+    assert detect_date_format(pd.Series([], dtype=str)) is None
+
+
+def test_parse_dates():
+    # only every other date is sampled, so the odd ones out aren't seen
+    dates = pd.Series(["1/2/24", "12/31/24"] * 1000)
+    dates[[1, 3]] = ["13/01/2024", "Feb 3, 2024"]
+    parsed, path = parse_dates(dates)
+
+    assert path == "%m/%d/%y, with 2 mixed"
+    assert parsed[:4].tolist() == [
+        pd.Timestamp("2024-01-02"),
+        pd.Timestamp("2024-01-13"),
+        pd.Timestamp("2024-01-02"),
+        pd.Timestamp("2024-02-03"),
+    ]
+
+    assert parse_dates(pd.Series(["01/02/2024"]))[1] == "mixed"
+    assert DATE_PARSING_ATTR in sample_data().attrs
@@ -0,0 +1,57 @@
+import pandas as pd
+import shutil
+from datetime import date
+from os.path import exists, join
+
+import src.read_data.journal as journal
+from src.read_data.column import Column
+from src.read_data.data_cache import load_cache, save_cache
+from src.read_data.read_data import _parse_data
+from src.read_data.write_data import compact_journal, write_data
+
+
+def _row(day: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            Column.DATE: [date(2024, 2, day)],
+            "Description": ["Snack"],
+            "Vendor": [""],
+            Column.CATEGORY: ["Eating Out"],
+            Column.PRICE: [4.5],
+            Column.IS_FOOD: [1],
+            Column.CONTROLLABLE: [1],
+        }
+    )
+
+
+def test_journal(tmp_path):
+    path = str(tmp_path / "Spending.xlsx")
+    shutil.copy(join("tests", "sample_data.xlsx"), path)
+    sheet = (tmp_path / "Spending.xlsx").read_bytes()
+    save_cache(path, _parse_data(path))
+
+    write_data(_row(20), path, mode="a")
+    write_data(_row(21), path, mode="a")
+    assert (tmp_path / "Spending.xlsx").read_bytes() == sheet
+    assert load_cache(path) is None
+
+    merged = _parse_data(path)
+    assert (
+        merged.shape[0] == _parse_data(join("tests", "sample_data.xlsx")).shape[0] + 2
+    )
+    save_cache(path, merged)
+
+    compact_journal(path)
+    assert not exists(journal.journal_path(path))
+    pd.testing.assert_frame_equal(_parse_data(path), merged)
+    pd.testing.assert_frame_equal(load_cache(path), merged, check_names=False)
+
+
+def test_journal_threshold(tmp_path, monkeypatch):
+    path = str(tmp_path / "Spending.xlsx")
+    shutil.copy(join("tests", "sample_data.xlsx"), path)
+    monkeypatch.setattr(journal, "JOURNAL_MAX_BYTES", 1)
+
+    write_data(_row(20), path, mode="a")
+    assert not exists(journal.journal_path(path))
+    assert _parse_data(path)[Column.DATE].max() == pd.Timestamp(2024, 2, 20)
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+import shutil
+from datetime import date
+from os.path import join
+
+from src.read_data.read_data import (
+    _parse_data,
+    append_data,
+    read_csv_chunks,
+    read_data,
+    transaction_ids,
+)
+from src.read_data.column import Column
+
+from tests.test_utils import sample_data
+
+
+def test_transaction_ids():
+    data = sample_data()
+    ids = data[Column.TRANSACTION_ID].to_numpy()
+
+    assert ids.dtype == np.uint64
+    assert len(set(ids)) == data.shape[0]
+    assert np.array_equal(transaction_ids(data), ids)
+
+    duplicated = data.iloc[[0, 0]].reset_index(drop=True)
+    assert len(set(transaction_ids(duplicated))) == 2
+
+
+def test_compact_dtypes():
+    data = sample_data()
+
+    assert isinstance(data[Column.CATEGORY].dtype, pd.CategoricalDtype)
+    assert data[Column.IS_FOOD].dtype == np.bool_
+    assert data[Column.CONTROLLABLE].dtype == np.bool_
+
+
+def test_read_csv_chunks(tmp_path):
+    data = sample_data()
+    path = str(tmp_path / "Spending.csv")
+    data.drop(columns=Column.TRANSACTION_ID).to_csv(path, index=False)
+
+    chunks = list(read_csv_chunks(path, 5))
+    assert [chunk.shape[0] for chunk in chunks] == [5, 5, data.shape[0] - 10]
+
+    streamed = pd.concat(chunks)
+    assert "Description" not in streamed.columns
+    for col in (Column.DATE, Column.PRICE, Column.IS_FOOD, Column.CONTROLLABLE):
+        assert streamed[col].tolist() == data[col].tolist()
+
+    described = next(read_csv_chunks(path, 5, ["Description"]))
+    assert described["Description"].tolist() == data["Description"][:5].tolist()
+
+
+@pytest.mark.parametrize("extn", [".xlsx", ".csv"])
+def test_append_data(tmp_path, extn):
+    path = str(tmp_path / f"Spending{extn}")
+    if extn == ".xlsx":
+        shutil.copy(join("tests", "sample_data.xlsx"), path)
+    else:
+        flags = {Column.IS_FOOD: int, Column.CONTROLLABLE: int}
+        sample_data().drop(columns=Column.TRANSACTION_ID).astype(flags).to_csv(
+            path, index=False
+        )
+
+    before = read_data(path)
+
+    row = {col: [""] for col in before.columns.drop(Column.TRANSACTION_ID)}
+    row |= {
+        Column.DATE: [date(2024, 2, 20)],
+        Column.CATEGORY: ["New Category"],
+        Column.PRICE: [12.5],
+        Column.IS_FOOD: [1],
+        Column.CONTROLLABLE: [0],
+    }
+    appended = append_data(pd.DataFrame(row), path)
+
+    assert appended.shape[0] == before.shape[0] + 1
+    pd.testing.assert_frame_equal(appended, _parse_data(path), check_names=False)
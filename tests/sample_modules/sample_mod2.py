@@ -1,3 +1,6 @@
+from src.utilities.metrics import metric
+
+
 def func3():
     pass
 
@@ -6,5 +9,6 @@ def func4():
     pass
 
 
+@metric()
 def func5():
     pass
@@ -0,0 +1,65 @@
+import pytest
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from src.drivers.visualization_driver import render_changed
+from src.read_data.read_data import get_month_dfs
+from src.utilities.archive import ArchiveWriter, archiving_to
+from src.visualizations.monthly.spent_by_week import spent_by_week
+
+from tests.test_utils import sample_data
+
+
+def test_archive_writer(tmp_path):
+    root = tmp_path / "2024"
+    (root / "plots" / ".staging1").mkdir(parents=True)
+    (root / "plots" / ".staging1" / "by_week.png").write_bytes(b"staged")
+    (root / "plots" / "by_week.png").write_bytes(b"png")
+    (root / "plots" / ".manifest.json").write_text("{}")
+    (root / "aggregation.csv").write_text("a,b\n" * 100)
+    (root / "Spending.xlsx").write_bytes(b"sheet")
+    (root / ".Spending.xlsx.journal.csv").write_text("a,b\n")
+
+    out = tmp_path / "out.zip"
+    with ArchiveWriter(str(out), str(root)) as archive:
+        archive.add(str(root / "aggregation.csv"))
+        archive.add_tree()
+
+    with ZipFile(out) as zf:
+        infos = {info.filename: info for info in zf.infolist()}
+        assert sorted(infos) == ["aggregation.csv", "plots/by_week.png"]
+        assert infos["aggregation.csv"].compress_type == ZIP_DEFLATED
+        assert infos["plots/by_week.png"].compress_type == ZIP_STORED
+        assert zf.read("plots/by_week.png") == b"png"
+
+
+def test_archive_writer_failed(tmp_path):
+    out = tmp_path / "out.zip"
+    with pytest.raises(ValueError):
+        with ArchiveWriter(str(out), str(tmp_path)):
+            raise ValueError()
+
+    assert not out.exists()
+
+
+def test_archive_while_rendering(tmp_path):
+    data = sample_data()
+    plots_dir = tmp_path / "plots"
+    items = []
+    for i, df in enumerate(get_month_dfs(data)):
+        out_dir = plots_dir / str(i)
+        out_dir.mkdir(parents=True)
+        items.append((spent_by_week, df, str(out_dir)))
+
+    for name in ("first.zip", "second.zip"):
+        with ArchiveWriter(str(tmp_path / name), str(tmp_path)) as archive:
+            with archiving_to(archive):
+                render_changed(items, str(plots_dir))
+
+    with ZipFile(tmp_path / "first.zip") as first:
+        with ZipFile(tmp_path / "second.zip") as second:
+            names = sorted(first.namelist())
+            assert names == sorted(second.namelist())
+            assert len(names) == len(items)
+            for name in names:
+                assert (tmp_path / name).read_bytes() == first.read(name)
+                assert first.read(name) == second.read(name)
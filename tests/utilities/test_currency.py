@@ -0,0 +1,58 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utilities.currency import CurrencyFormatter
+
+US = {
+    "currency_symbol": "$",
+    "mon_decimal_point": ".",
+    "mon_thousands_sep": ",",
+    "mon_grouping": [3, 3, 0],
+    "positive_sign": "",
+    "negative_sign": "-",
+    "frac_digits": 2,
+    "p_cs_precedes": 1,
+    "p_sep_by_space": 0,
+    "n_cs_precedes": 1,
+    "n_sep_by_space": 0,
+    "p_sign_posn": 1,
+    "n_sign_posn": 1,
+}
+
+
+def test_format():
+    formatter = CurrencyFormatter(US)
+    assert formatter.format(0.0) == "$0.00"
+    assert formatter.format(1234567.891) == "$1,234,567.89"
+    assert formatter.format(-999.999) == "-$1,000.00"
+
+    german = CurrencyFormatter(
+        US
+        | {
+            "currency_symbol": "EUR",
+            "mon_decimal_point": ",",
+            "mon_thousands_sep": ".",
+            "p_cs_precedes": 0,
+            "n_cs_precedes": 0,
+            "p_sep_by_space": 1,
+            "n_sep_by_space": 1,
+            "n_sign_posn": 0,
+        }
+    )
+    assert german.format(1234.5) == "1.234,50 EUR"
+    assert german.format(-12.5) == "(12,50 EUR)"
+
+
+def test_format_all():
+    formatter = CurrencyFormatter(US)
+    amounts = [i * 1234.5 - 10_000 for i in range(100)]
+    expected = list(map(formatter.format, amounts))
+    assert formatter.format_all(amounts) == expected
+
+    with ThreadPoolExecutor(4) as pool:
+        assert list(pool.map(formatter.format_all, [amounts] * 8)) == [expected] * 8
+
+
+def test_c_locale():
+    with pytest.raises(ValueError):
+        CurrencyFormatter(US | {"frac_digits": 127}).format(1.0)
@@ -1,5 +1,6 @@
+import pandas as pd
 from dataclasses import dataclass, asdict
-from src.utilities.decorators import dataclass_from_converted_json
+from src.utilities.decorators import dataclass_from_converted_json, cache_by_frame
 
 
 class DataclassFromJsonTestClass:
@@ -27,3 +28,20 @@ def test_dataclass_from_json():
     var2 = deco2(DataclassFromJsonTestClass)(fields)
 
     assert sorted(asdict(var1).items()) == sorted(asdict(var2).items())
+
+
+def test_cache_by_frame():
+    calls = []
+
+    @cache_by_frame
+    def count_rows(df):
+        calls.append(df)
+        return df.shape[0]
+
+    df1 = pd.DataFrame({"col1": [1, 2, 3]})
+    df2 = df1.copy()
+
+    assert count_rows(df1) == 3
+    assert count_rows(df1) == 3
+    assert count_rows(df2) == 3
+    assert len(calls) == 2
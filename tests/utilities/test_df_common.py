@@ -1,6 +1,13 @@
 import math
-
-from src.utilities.df_common import group_by_month, group_by_week
+from datetime import date
+
+from src.utilities.df_common import (
+    group_by_month,
+    group_by_week,
+    memory_report,
+    partition_by_dates,
+    period_codes,
+)
 from src.read_data.column import Column
 
 from tests.test_utils import sample_data
@@ -30,3 +37,26 @@ def test_group_by_week():
     assert len(partitions) == num_weeks
 
     assert sum(map(lambda p: p.shape[0], partitions)) == data.shape[0]
+
+
+def test_partition_by_dates():
+    data = sample_data().sample(frac=1, random_state=0)
+    starts = [date(2024, 1, 1), date(2024, 1, 15), date(2024, 2, 1)]
+
+    codes = period_codes(data[Column.DATE], starts)
+    partitions = partition_by_dates(data, starts)
+
+    assert len(partitions) == len(starts)
+    for i, p in enumerate(partitions):
+        assert p[Column.DATE].is_monotonic_increasing
+        assert sorted(p.index) == sorted(data.index[codes == i])
+
+
+def test_memory_report(capsys):
+    data = sample_data()
+    memory_report(data)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == data.shape[1] + 1
+    assert lines[-1].startswith("Total")
+    assert f"{data.memory_usage(deep=True, index=False).sum():,} B" in lines[-1]
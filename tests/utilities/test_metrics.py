@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+
+from src.utilities.metrics import (
+    evaluation_order,
+    metric,
+    metric_stats,
+    reset_metric_stats,
+)
+from src.read_data.column import Column
+from src.utilities.profiling import (
+    Profiled,
+    disable_profiling,
+    enable_profiling,
+    take_spans,
+)
+
+from tests.test_utils import sample_data
+
+
+@metric()
+def _spent(df: pd.DataFrame) -> float:
+    return df[Column.PRICE].sum()
+
+
+@metric(_spent)
+def _double_spent(df: pd.DataFrame) -> float:
+    return 2 * _spent(df)
+
+
+def test_metric():
+    data = sample_data()
+    reset_metric_stats()
+
+    assert _double_spent(data) == 2 * _spent(data)
+    assert _double_spent(data) == 2 * _spent(data.copy())
+
+    stats = metric_stats()
+    assert stats["_spent"].misses == 2 and stats["_spent"].hits == 1
+    assert stats["_double_spent"].misses == 1 and stats["_double_spent"].hits == 1
+
+
+def test_evaluation_order():
+    assert evaluation_order([_double_spent]) == [_spent, _double_spent]
+    assert evaluation_order([_spent, _double_spent]) == [_spent, _double_spent]
+
+    @metric(_double_spent)
+    def _cyclic(df: pd.DataFrame) -> float:
+        return 0
+
+    _cyclic.__metric_inputs__ = (_double_spent, _cyclic)
+    with pytest.raises(ValueError):
+        evaluation_order([_cyclic])
+
+
+def test_evaluation_order_profiled():
+    data = sample_data().copy()
+    spent, double_spent = Profiled(_spent, "test"), Profiled(_double_spent, "test")
+    order = evaluation_order([double_spent, spent])
+    assert order == [spent, double_spent]
+
+    reset_metric_stats()
+    enable_profiling()
+    try:
+        for func in order:
+            func(data)
+
+        spans = take_spans()
+
+    finally:
+        disable_profiling()
+
+    assert [span.name for span in spans] == ["_spent", "_double_spent"]
+    assert metric_stats()["_spent"] == (1, 1)
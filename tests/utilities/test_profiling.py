@@ -0,0 +1,58 @@
+import json
+import pickle
+
+from src.utilities.profiling import (
+    Profiled,
+    disable_profiling,
+    enable_profiling,
+    profiled,
+    stage,
+    take_spans,
+    write_profile,
+)
+
+
+def _allocate(n: int) -> int:
+    return len(list(range(n)))
+
+
+def test_stage():
+    enable_profiling()
+    try:
+        with stage("outer", "test"):
+            with stage("inner", "test"):
+                _allocate(100_000)
+
+        inner, outer = take_spans()
+
+    finally:
+        disable_profiling()
+
+    assert (inner.name, outer.name) == ("inner", "outer")
+    assert outer.wall >= inner.wall
+    assert outer.peak_memory >= inner.peak_memory > 100_000
+
+
+def test_profiled(tmp_path):
+    assert profiled(_allocate, "test") is _allocate
+
+    enable_profiling()
+    try:
+        wrapped = profiled(_allocate, "test")
+        assert isinstance(wrapped, Profiled) and wrapped.__name__ == "_allocate"
+        assert pickle.loads(pickle.dumps(wrapped))(10) == 10
+
+        write_profile(str(tmp_path / "profile.json"), str(tmp_path / "trace.json"))
+
+    finally:
+        disable_profiling()
+        take_spans()
+
+    with open(tmp_path / "profile.json") as f:
+        stages = json.load(f)["stages"]
+
+    with open(tmp_path / "trace.json") as f:
+        events = json.load(f)["traceEvents"]
+
+    assert [s["name"] for s in stages] == ["_allocate"] and stages[0]["calls"] == 1
+    assert [e["name"] for e in events] == ["_allocate"]
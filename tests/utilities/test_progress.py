@@ -0,0 +1,62 @@
+import pytest
+from os import listdir
+from threading import Thread
+
+from src.drivers.visualization_driver import render_plots
+from src.read_config.plotters_from_config import plotters_from_config
+from src.utilities.progress import (
+    Cancelled,
+    Progress,
+    report_progress,
+    reporting_to,
+)
+
+from tests.test_utils import sample_data
+
+
+def test_report_progress():
+    report_progress("not followed")
+
+    progress = Progress()
+    with reporting_to(progress):
+        report_progress("first")
+        report_progress("second")
+
+    report_progress("not followed")
+    assert [progress.events.get_nowait() for _ in range(2)] == ["first", "second"]
+    assert progress.events.empty()
+
+
+def test_report_progress_threads():
+    progress = Progress()
+    other = Progress()
+
+    def report_elsewhere() -> None:
+        with reporting_to(other):
+            report_progress("elsewhere")
+
+    with reporting_to(progress):
+        thread = Thread(target=lambda: report_progress("other thread"))
+        thread.start()
+        thread.join()
+
+        thread = Thread(target=report_elsewhere)
+        thread.start()
+        thread.join()
+        report_progress("this thread")
+
+    assert progress.events.get_nowait() == "this thread"
+    assert other.events.get_nowait() == "elsewhere"
+    assert progress.events.empty() and other.events.empty()
+
+
+def test_cancel(tmp_path):
+    _, yearlys = plotters_from_config()
+    progress = Progress()
+    progress.cancelled.set()
+
+    with reporting_to(progress):
+        with pytest.raises(Cancelled):
+            render_plots([(y, sample_data(), str(tmp_path)) for y in yearlys])
+
+    assert listdir(tmp_path) == []
@@ -0,0 +1,22 @@
+from src.visualizations.yearly.sankey_flow import Flow, _get_flows, _subtotals
+
+
+def test_get_flows():
+    tree = {
+        "Saved": 10,
+        "Spent": {"Food": {"Groceries": 5, "Eating Out": 0}, "Rent": 20},
+        "Empty": {},
+    }
+    totals = {}
+    assert _subtotals(tree, totals) == 35
+
+    flows = []
+    _get_flows("Income", tree, totals, flows)
+    assert [flow[:3] for flow in flows] == [
+        ("Income", "Saved", 10),
+        ("Income", "Spent", 25),
+        ("Spent", "Food", 5),
+        ("Spent", "Rent", 20),
+        ("Food", "Groceries", 5),
+    ]
+    assert flows[0] == Flow("Income", "Saved", 10, {"flow_color_mode": "source"})
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from src.read_data.column import Column
+from src.visualizations.yearly.saved_over_time import _balance
+
+
+def test_balance():
+    df = pd.DataFrame(
+        {
+            Column.DATE: pd.to_datetime(
+                ["2024-01-01", "2024-01-01", "2024-01-03", "2024-01-08"]
+            ),
+            Column.PRICE: [10.0, 5.0, 20.0, 1.0],
+        }
+    )
+    payments = list(pd.to_datetime(["2024-01-01", "2024-01-08"]))
+
+    x, y = _balance(df, payments, 100.0, 0)
+    assert list(x.astype("datetime64[D]").astype(str)) == [
+        "2024-01-01",
+        "2024-01-01",
+        "2024-01-03",
+        "2024-01-08",
+        "2024-01-08",
+    ]
+    np.testing.assert_array_equal(y, [100.0, 85.0, 65.0, 165.0, 164.0])
+
+    x_all, y_all = _balance(df, payments, 100.0, 5)
+    np.testing.assert_array_equal(x_all, x)
+    np.testing.assert_array_equal(y_all, y)
+
+    # the 8 days are split into 4 bins of 2 days
+    x, y = _balance(df, payments, 100.0, 4)
+    assert list(x.astype("datetime64[D]").astype(str)) == [
+        "2024-01-01",
+        "2024-01-03",
+        "2024-01-08",
+    ]
+    np.testing.assert_array_equal(y, [85.0, 65.0, 164.0])
+
+    # and into 3 bins of 3 days, the second of which is empty
+    x, y = _balance(df, payments, 100.0, 3)
+    assert list(x.astype("datetime64[D]").astype(str)) == ["2024-01-03", "2024-01-08"]
+    np.testing.assert_array_equal(y, [65.0, 164.0])